@@ -6,7 +6,7 @@ from gi.repository import GLib
 from syncsonic_ble.svc_singleton import service
 from syncsonic_ble.flow.connection_service import Intent
 import subprocess
-from utils.pulseaudio_service import create_loopback, remove_loopback_for_device, setup_pulseaudio
+from syncsonic_ble.utils.pulseaudio_service import create_loopback, remove_loopback_for_device, setup_pulseaudio
 from endpoints.volume import set_stereo_volume
 from phone_connection_agent import PhonePairingAgent, CAPABILITY
 import os
@@ -18,7 +18,7 @@ def queue_connect_one(data):
     return _submit(Intent.CONNECT_ONE, {
         "mac":           tgt.get("mac"),
         "friendly_name": tgt.get("name", ""),
-        "allowed":       data.get("allowed", []),
+        "allowed":       data.get("allowed", ()),
     })
 
 def queue_disconnect(data):
@@ -15,6 +15,7 @@ DBUS_PROP_IFACE              = "org.freedesktop.DBus.Properties"
 # Core adapter/device interfaces
 ADAPTER_INTERFACE            = "org.bluez.Adapter1"
 DEVICE_INTERFACE             = "org.bluez.Device1"
+MEDIA_TRANSPORT_INTERFACE    = "org.bluez.MediaTransport1"
 
 # GATT registration & runtime interfaces
 GATT_MANAGER_IFACE           = "org.bluez.GattManager1"
@@ -34,6 +35,9 @@ AGENT_PATH                   = "/com/syncsonic/pair_agent"
 SERVICE_UUID                 = "19b10000-e8f2-537e-4f6c-d104768a1214"
 CHARACTERISTIC_UUID          = "19b10001-e8f2-537e-4f6c-d104768a1217"
 
+# Bluetooth profile UUIDs
+A2DP_UUID                    = "0000110b-0000-1000-8000-00805f9b34fb"   # A2DP sink
+
 
 
 # Message types – converted to an Enum for type‑safety -----------------------
@@ -15,15 +15,9 @@ class Advertisement(dbus.service.Object):
         self.local_name      = 'Sync-Sonic'
         self.include_tx_power= True
         self.discoverable    = True
-        super().__init__(bus, self.path)
-        log.info(f"Advertisement created at {self.path}")
-
-    def get_path(self) -> dbus.ObjectPath:
-        """Return this advertisement’s D-Bus object path."""
-        return dbus.ObjectPath(self.path)
-
-    def get_properties(self) -> dict:
-        return {
+        self._obj_path       = dbus.ObjectPath(self.path)
+        # advertisement content is fixed once created – wrap the variants once
+        self._iface_props = {
             'org.bluez.LEAdvertisement1': {
                 'Type':           dbus.String(self.ad_type),
                 'ServiceUUIDs':   dbus.Array(self.service_uuids, signature='s'),
@@ -32,14 +26,23 @@ class Advertisement(dbus.service.Object):
                 'Discoverable':   dbus.Boolean(self.discoverable),
             }
         }
+        super().__init__(bus, self.path)
+        log.info(f"Advertisement created at {self.path}")
+
+    def get_path(self) -> dbus.ObjectPath:
+        """Return this advertisement’s D-Bus object path."""
+        return self._obj_path
+
+    def get_properties(self) -> dict:
+        return self._iface_props
 
     @dbus.service.method('org.freedesktop.DBus.Properties', in_signature='ss', out_signature='v')
     def Get(self, interface, prop):
-        return self.get_properties()['org.bluez.LEAdvertisement1'][prop]
+        return self._iface_props['org.bluez.LEAdvertisement1'][prop]
 
     @dbus.service.method('org.freedesktop.DBus.Properties', in_signature='s', out_signature='a{sv}')
     def GetAll(self, interface):
-        return self.get_properties()['org.bluez.LEAdvertisement1']
+        return self._iface_props['org.bluez.LEAdvertisement1']
 
     @dbus.service.method('org.bluez.LEAdvertisement1', in_signature='', out_signature='')
     def Release(self):
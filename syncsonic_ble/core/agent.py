@@ -13,6 +13,10 @@ log = get_logger(__name__)
 # Capability for DisplayYesNo pairing
 CAPABILITY = "DisplayYesNo"
 
+# Fixed answers for legacy PIN / passkey requests, built once
+_PIN = "0000"
+_PASSKEY_ZERO = dbus.UInt32(0)
+
 class PhonePairingAgent(dbus.service.Object):
     """BlueZ Agent1 implementation to handle pairing requests."""
 
@@ -26,33 +30,33 @@ class PhonePairingAgent(dbus.service.Object):
 
     @dbus.service.method(AGENT_INTERFACE, in_signature="os", out_signature="")
     def AuthorizeService(self, device: str, uuid: str):
-        log.info(f"Agent.AuthorizeService(device={device}, uuid={uuid}) called")
+        log.info("Agent.AuthorizeService(device=%s, uuid=%s) called", device, uuid)
 
     @dbus.service.method(AGENT_INTERFACE, in_signature="ou", out_signature="")
     def RequestConfirmation(self, device: str, passkey: int):
-        log.info(f"Agent.RequestConfirmation(device={device}, passkey={passkey}) called")
+        log.info("Agent.RequestConfirmation(device=%s, passkey=%s) called", device, passkey)
 
     @dbus.service.method(AGENT_INTERFACE, in_signature="o", out_signature="s")
     def RequestPinCode(self, device: str) -> str:
-        log.info(f"Agent.RequestPinCode(device={device}) called")
-        return "0000"
+        log.info("Agent.RequestPinCode(device=%s) called", device)
+        return _PIN
 
     @dbus.service.method(AGENT_INTERFACE, in_signature="o", out_signature="u")
     def RequestPasskey(self, device: str) -> int:
-        log.info(f"Agent.RequestPasskey(device={device}) called")
-        return dbus.UInt32(0)
+        log.info("Agent.RequestPasskey(device=%s) called", device)
+        return _PASSKEY_ZERO
 
     @dbus.service.method(AGENT_INTERFACE, in_signature="ou", out_signature="")
     def DisplayPasskey(self, device: str, passkey: int):
-        log.info(f"Agent.DisplayPasskey(device={device}, passkey={passkey}) called")
+        log.info("Agent.DisplayPasskey(device=%s, passkey=%s) called", device, passkey)
 
     @dbus.service.method(AGENT_INTERFACE, in_signature="os", out_signature="")
     def DisplayPinCode(self, device: str, pincode: str):
-        log.info(f"Agent.DisplayPinCode(device={device}, pincode={pincode}) called")
+        log.info("Agent.DisplayPinCode(device=%s, pincode=%s) called", device, pincode)
 
     @dbus.service.method(AGENT_INTERFACE, in_signature="o", out_signature="")
     def RequestAuthorization(self, device: str):
-        log.info(f"Agent.RequestAuthorization(device={device}) called")
+        log.info("Agent.RequestAuthorization(device=%s) called", device)
 
     @dbus.service.method(AGENT_INTERFACE, in_signature="", out_signature="")
     def Cancel(self):
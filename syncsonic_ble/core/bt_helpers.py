@@ -1,16 +1,57 @@
-from gi.repository import GLib
-import time
+from gi.repository import GLib, Gio
+from ..constants import (
+    BLUEZ_SERVICE_NAME,
+    DBUS_PROP_IFACE,
+    ADAPTER_INTERFACE,
+    DEVICE_INTERFACE,
+)
 from ..utils.pulseaudio_service import remove_loopback_for_device
 
+# Pair() gives up after this long.  Without it the only bound is the D-Bus
+# default (25 s), and a speaker that never answers holds the worker that long.
+PAIR_TIMEOUT_S = 15
+
+# Pre-built argument tuple for Properties.Set(Device1, "Trusted", true)
+_TRUSTED_ARGS = GLib.Variant("(ssv)", (DEVICE_INTERFACE, "Trusted", GLib.Variant("b", True)))
+
+
+def _call(bus, path: str, iface: str, method: str, args=None, timeout_ms: int = -1):
+    """Invoke a BlueZ method straight on the pydbus connection.
+
+    ``bus.get()`` introspects the remote object on every call, which costs an
+    extra round trip plus an XML parse; the helpers below only ever need one
+    method, so skip the proxy entirely.
+    """
+    return bus.con.call_sync(
+        BLUEZ_SERVICE_NAME, path, iface, method, args,
+        None, Gio.DBusCallFlags.NONE, timeout_ms, None,
+    )
+
+
+def _timed_out(e: Exception) -> bool:
+    """True if *e* is a method call that ran out of time.
+
+    call_sync's own timeout_ms raises the local G_IO_ERROR_TIMED_OUT
+    ("Timeout was reached"), not a D-Bus error name, so check both.
+    """
+    if isinstance(e, GLib.Error) and e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.TIMED_OUT):
+        return True
+    return "NoReply" in str(e) or "TimedOut" in str(e)
+
+
 def get_adapter_path_from_device(device_path: str) -> str:
-    return "/".join(device_path.split("/")[:4])
+    # "/org/bluez/hciX/dev_…" → "/org/bluez/hciX": slice at the 4th "/"
+    i = -1
+    for _ in range(4):
+        i = device_path.find("/", i + 1)
+        if i < 0:
+            return device_path
+    return device_path[:i]
 
 
 def connect_device_dbus(device_path: str, bus) -> bool:
     try:
-        device = bus.get("org.bluez", device_path)
-     
-        device.Connect()
+        _call(bus, device_path, DEVICE_INTERFACE, "Connect")
         return True
     except Exception as e:
      
@@ -19,37 +60,53 @@ def connect_device_dbus(device_path: str, bus) -> bool:
 
 def trust_device_dbus(device_path: str, bus) -> bool:
     try:
-        device = bus.get("org.bluez", device_path)
-   
-        device.Trusted = True
+        _call(bus, device_path, DBUS_PROP_IFACE, "Set", _TRUSTED_ARGS)
         return True
     except Exception as e:
     
         return False
 
 
-def pair_device_dbus(device_path: str, bus) -> bool:
+def pair_device_dbus(device_path: str, bus, timeout_s: float = PAIR_TIMEOUT_S) -> bool:
     try:
-        time.sleep(1.5)
-        device = bus.get("org.bluez", device_path)
-     
-        device.Pair()
+        _call(bus, device_path, DEVICE_INTERFACE, "Pair", timeout_ms=int(timeout_s * 1000))
         return True
     except Exception as e:
         if "AlreadyExists" in str(e):
           
             return True  # treat as success
-        else:
-      
-            return False
+        if _timed_out(e):
+            # our call gave up but BlueZ is still pairing – stop it so the
+            # next attempt starts clean
+            try:
+                _call(bus, device_path, DEVICE_INTERFACE, "CancelPairing", timeout_ms=2000)
+            except Exception:
+                pass
+        return False
+
+
+def pair_and_trust_dbus(device_path: str, bus, timeout_s: float = PAIR_TIMEOUT_S) -> bool:
+    """Pair *device_path* and mark it trusted without a second round trip.
+
+    The Trusted write goes out first as a no-reply message; D-Bus keeps
+    per-connection ordering, so BlueZ applies it before handling Pair().
+    """
+    try:
+        msg = Gio.DBusMessage.new_method_call(
+            BLUEZ_SERVICE_NAME, device_path, DBUS_PROP_IFACE, "Set")
+        msg.set_body(_TRUSTED_ARGS)
+        msg.set_flags(Gio.DBusMessageFlags.NO_REPLY_EXPECTED)
+        bus.con.send_message(msg, Gio.DBusSendMessageFlags.NONE)
+    except Exception as e:
+        pass
+    return pair_device_dbus(device_path, bus, timeout_s)
 
 
 def remove_device_dbus(device_path: str, bus) -> bool:
     adapter_path = get_adapter_path_from_device(device_path)
     try:
-        adapter = bus.get("org.bluez", adapter_path)
-     
-        adapter.RemoveDevice(device_path)
+        _call(bus, adapter_path, ADAPTER_INTERFACE, "RemoveDevice",
+              GLib.Variant("(o)", (device_path,)))
         return True
     except Exception as e:
   
@@ -57,16 +114,13 @@ def remove_device_dbus(device_path: str, bus) -> bool:
 
 
 
-def disconnect_device_dbus(device_path: str, mac: str, bus) -> bool:
+def disconnect_device_dbus(device_path: str, bus) -> bool:
     """
     Disconnects the specified Bluetooth device using its full D-Bus path.
+    D-Bus only: the caller owns tearing down the speaker's loopback.
     """
     try:
-        device = bus.get("org.bluez", device_path)
-       
-        device.Disconnect()
-        remove_loopback_for_device(mac)
-
+        _call(bus, device_path, DEVICE_INTERFACE, "Disconnect")
         return True
     except Exception as e:
     
@@ -79,25 +133,22 @@ def disconnect_all_instances(mac: str, objects: dict, bus) -> bool:
     Uses the full D-Bus object tree instead of any global state.
     """
     mac = mac.upper()
-    mac_fmt = mac.replace(":", "_")
+    # BlueZ names every instance of a device …/hciX/dev_AA_BB_…, so the path
+    # alone picks out the candidates – no per-object Address compare needed.
+    suffix = "/dev_" + mac.replace(":", "_")
     attempted = False
 
     for path, ifaces in objects.items():
-        if "org.bluez.Device1" in ifaces:
-            dev = ifaces["org.bluez.Device1"]
-            address = dev.get("Address", "").upper()
-            connected = dev.get("Connected", False)
-            if address == mac and connected:
-                try:
-                    device = bus.get("org.bluez", path)
-                  
-                    device.Disconnect()
-                    remove_loopback_for_device(mac)
-             
-                    attempted = True
-                except Exception as e:
-                    pass
-                   
-
-
+        if not path.endswith(suffix):
+            continue
+        dev = ifaces.get(DEVICE_INTERFACE)
+        if dev and dev.get("Connected", False):
+            try:
+                _call(bus, path, DEVICE_INTERFACE, "Disconnect")
+                attempted = True
+            except Exception as e:
+                pass
+
+    if attempted:
+        remove_loopback_for_device(mac)
     return attempted
@@ -1,23 +1,30 @@
 """GATT characteristic that carries our JSON command protocol."""
 from __future__ import annotations
 
-import json, subprocess, dbus
+import json, dbus
 from typing import Dict, Any
 from ..flow.scan_manager import ScanManager
+from ..flow.connection_service import Intent
 from ..logging_conf import get_logger
+from ..infra.bluez_cache import get_object_cache
 from ..constants import (
     GATT_CHRC_IFACE, DBUS_PROP_IFACE, GATT_SERVICE_IFACE, DEVICE_INTERFACE,
-    Msg, CHARACTERISTIC_UUID, DBUS_OM_IFACE, ADAPTER_INTERFACE
+    Msg, CHARACTERISTIC_UUID, ADAPTER_INTERFACE
 )
 
 from ..utils.pulseaudio_service import create_loopback, remove_loopback_for_device
-from ..endpoints.volume import set_stereo_volume
+from ..endpoints.volume import queue_stereo_volume, set_mute
 import os
 import time
-from ..constants import BLUEZ_SERVICE_NAME
 
 log = get_logger(__name__)
 
+# Compact separators: every byte we save is a byte less over the BLE link
+_json_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# Direct value → member table; skips Enum.__call__ on every write
+_MSG_BY_VAL = {m.value: m for m in Msg}
+
 
 
 
@@ -25,18 +32,58 @@ class Characteristic(dbus.service.Object):
     def __init__(self, bus, index, uuid, flags, service):
         # build the object path under the service
         self.path = f"{service.get_path()}/char{index}"
+        self._obj_path = dbus.ObjectPath(self.path)
         self.bus = bus
         self.uuid = uuid
         self.flags = flags
         self.service = service
-        self.value = [dbus.Byte(0)] * 5
+        # live GattCharacteristic1 property dict – `value` / `notifying`
+        # write straight into it, so cached GetManagedObjects replies stay current
+        self._props = {
+            "Service": service.get_path(),
+            "UUID": dbus.String(uuid),
+            "Flags": dbus.Array(flags, signature="s"),
+        }
+        self._iface_props = {GATT_CHRC_IFACE: self._props}
+        self.value = dbus.ByteArray(bytes(5))
         self.notifying = False
         self.connected_devices = set()
         self.device_manager = None
         self._scan_mgr = None
         self._scan_adapter_mac = None
+        self._adapter_path = f"/org/bluez/{os.getenv('RESERVED_HCI')}"  # e.g. …/hci3
+        self._paired_cache = None      # encoded GET_PAIRED_DEVICES reply
         super().__init__(bus, self.path)
 
+        # bound late: importing svc_singleton starts the ConnectionService
+        from syncsonic_ble.svc_singleton import service
+        self._svc = service
+
+        # drop the cached paired list whenever BlueZ's view of it may change;
+        # hooked on the object cache so it always runs after the cache update
+        cache = get_object_cache()
+        cache.on_added(self._invalidate_paired)
+        cache.on_removed(self._invalidate_paired)
+        cache.on_props_changed(self._on_device_props_changed)
+
+        # property name → current value, for Get()
+        self._getters = {
+            "Value": lambda: self.value,
+        }
+
+        # command → handler table, built once instead of on every write
+        self._dispatch = {
+            Msg.PING:            self._handle_ping,
+            Msg.CONNECT_ONE:     self._handle_connect_one,
+            Msg.DISCONNECT:      self._handle_disconnect,
+            Msg.SET_LATENCY:     self._handle_set_latency,
+            Msg.SET_VOLUME:      self._handle_set_volume,
+            Msg.GET_PAIRED_DEVICES: self._handle_get_paired,
+            Msg.SET_MUTE:        self._handle_set_mute,
+            Msg.SCAN_START:      self._handle_scan_start,
+            Msg.SCAN_STOP:       self._handle_scan_stop,
+        }
+
         log.info("Characteristic created (%s)", uuid)
 
 
@@ -54,56 +101,55 @@ class Characteristic(dbus.service.Object):
         Encode *payload* under the given message type and send it as a BLE notification,
         if the client has enabled notifications.
         """
-        # 1) Build the byte array
-        data = self._encode(msg_type, payload)
+        if not self.notifying:
+            return
 
-        # 2) Log everything for full visibility
-        log.info(
-            "→ [BLE Notify] type=%s(0x%02x) payload=%s",
-            msg_type.name,
-            msg_type.value,
-            payload
+        data = self._encode(msg_type, payload)
+        log.debug("→ [BLE Notify] type=%s(0x%02x) len=%d",
+                  msg_type.name, msg_type.value, len(data))
+        self.PropertiesChanged(
+            GATT_CHRC_IFACE,
+            {"Value": data},
+            []
         )
 
-        # 3) Actually send if the client has turned on notifications
-        if self.notifying:
-            self.PropertiesChanged(
-                GATT_CHRC_IFACE,
-                {"Value": dbus.Array(data, signature="y")},
-                []
-            )
-
     # You can keep push_status as a thin wrapper for backward compatibility:
     def push_status(self, payload: Dict[str, Any]):
         self.send_notification(Msg.SUCCESS, payload)
 
     # ────────────────────── D‑Bus boilerplate ───────────────────────────────
+    @property
+    def value(self):
+        return self._props["Value"]
+
+    @value.setter
+    def value(self, data):
+        self._props["Value"] = data
+
+    @property
+    def notifying(self) -> bool:
+        return bool(self._props["Notifying"])
+
+    @notifying.setter
+    def notifying(self, on: bool):
+        self._props["Notifying"] = dbus.Boolean(on)
+
     def get_properties(self):
-        from ..constants import GATT_SERVICE_IFACE
-        return {
-            GATT_CHRC_IFACE: {
-                "Service": self.service.get_path(),
-                "UUID": self.uuid,
-                "Flags": self.flags,
-                "Value": self.value,
-                "Notifying": dbus.Boolean(self.notifying),
-            }
-        }
+        return self._iface_props
 
     def get_path(self):
-        return dbus.ObjectPath(self.path)
+        return self._obj_path
 
     @dbus.service.method(DBUS_PROP_IFACE, in_signature="ss", out_signature="v")
     def Get(self, interface, prop):
-        if prop == "Value":
-            return dbus.Array(self.value, signature="y")
-        return None
+        fn = self._getters.get(prop)
+        return fn() if fn else None
 
     # ───────────────────── Read/Write implementation ‑‑ JSON protocol ───────
     @dbus.service.method(GATT_CHRC_IFACE, in_signature="aya{sv}")
     def WriteValue(self, value, options):
         # verify backend is recieving notificatios
-        log.info("💥 Backend WriteValue fired! raw value=%s options=%s", value, options)
+        log.debug("💥 Backend WriteValue fired! len=%d", len(value))
         # CCCD write? ---------------------------------------------------------
         if len(value) == 2 and value[0] == 0x01:
             self.notifying = (value[1] == 0x01)
@@ -112,36 +158,28 @@ class Characteristic(dbus.service.Object):
 
         # normal command ------------------------------------------------------
         msg_type, data = self._decode(value)
-        handler = {
-            Msg.PING:            self._handle_ping,
-            Msg.CONNECT_ONE:     self._handle_connect_one,
-            Msg.DISCONNECT:      self._handle_disconnect,
-            Msg.SET_LATENCY:     self._handle_set_latency,
-            Msg.SET_VOLUME:      self._handle_set_volume,
-            Msg.GET_PAIRED_DEVICES: self._handle_get_paired,
-            Msg.SET_MUTE:        self._handle_set_mute,
-            Msg.SCAN_START:      self._handle_scan_start,
-            Msg.SCAN_STOP:       self._handle_scan_stop,
-        }.get(msg_type, self._unknown)
+        handler = self._dispatch.get(msg_type, self._unknown)
 
         response = handler(data)
         self.value = response
         if self.notifying:
-            self.PropertiesChanged(GATT_CHRC_IFACE, {"Value": dbus.Array(self.value)}, [])
+            self.PropertiesChanged(GATT_CHRC_IFACE, {"Value": self.value}, [])
 
     # ───────────────────── protocol helpers ---------------------------------
     def _encode(self, msg: Msg, payload: Dict[str, Any]):
-        raw = json.dumps(payload).encode()
-        out  = [dbus.Byte(msg)] + [dbus.Byte(b) for b in raw]
-        return out
+        # ByteArray marshals straight to "ay" – no per-byte dbus.Byte objects
+        raw = _json_dumps(payload).encode()
+        return dbus.ByteArray(bytes((msg,)) + raw)
 
     def _decode(self, value):
         try:
-            msg = Msg(value[0])
+            msg = _MSG_BY_VAL.get(int(value[0]))
+            if msg is None:
+                raise ValueError(f"{int(value[0])} is not a valid Msg")
             if len(value) == 1:
                 return msg, {}
-            data = json.loads(bytes(value[1:]).decode())
-            log.info("🧩 Decoded msg_type=%s, data=%s", msg, data)
+            data = json.loads(bytes(value[1:]))     # json accepts UTF-8 bytes
+            log.debug("🧩 Decoded msg_type=%s len=%d", msg, len(value))
             return msg, data
         except Exception as exc:
             log.error("decode error: %s", exc)
@@ -153,8 +191,6 @@ class Characteristic(dbus.service.Object):
         return self._encode(Msg.PONG, {"count": count})
 
     def _handle_connect_one(self, data):
-        from syncsonic_ble.svc_singleton import service
-        from ..flow.connection_service import Intent 
         tgt = data.get("targetSpeaker", {})
         mac = tgt.get("mac")
         if not mac:
@@ -163,10 +199,10 @@ class Characteristic(dbus.service.Object):
         payload = {
             "mac": mac,
             "friendly_name": tgt.get("name", ""),
-            "allowed": data.get("allowed", []),
+            "allowed": data.get("allowed", ()),
         }
         log.info("Queuing CONNECT_ONE %s", payload)
-        service.submit(Intent.CONNECT_ONE, payload)
+        self._svc.submit(Intent.CONNECT_ONE, payload)
 
 
 
@@ -176,12 +212,10 @@ class Characteristic(dbus.service.Object):
         return self._encode(Msg.SUCCESS, {"queued": True})
 
     def _handle_disconnect(self, data):
-        from syncsonic_ble.svc_singleton import service
-        from ..flow.connection_service import Intent 
         mac = data.get("mac")
         if not mac:
             return self._encode(Msg.ERROR, {"error": "Missing mac"})
-        service.submit(Intent.DISCONNECT, {"mac": mac})
+        self._svc.submit(Intent.DISCONNECT, {"mac": mac})
         return self._encode(Msg.SUCCESS, {"queued": True})
 
     def _handle_set_latency(self, data):
@@ -199,48 +233,44 @@ class Characteristic(dbus.service.Object):
         if mac is None or volume is None:
             return self._encode(Msg.ERROR, {"error": "Missing mac/volume"})
         bal = data.get("balance", 0.5)
-        ok, left, right = set_stereo_volume(mac, bal, int(volume))
-        if ok:
-            return self._encode(Msg.SUCCESS, {"left": left, "right": right})
-        return self._encode(Msg.ERROR, {"error": "volume failed"})
+        # coalesced with any further writes from the same slider drag
+        left, right = queue_stereo_volume(mac, bal, int(volume))
+        return self._encode(Msg.SUCCESS, {"left": left, "right": right})
 
     def _handle_get_paired(self, _):
-        om = dbus.Interface(self.bus.get_object("org.bluez", "/"), DBUS_OM_IFACE)
+        if self._paired_cache is not None:
+            return self._paired_cache
         paired = {
             v.get("Address"): (v.get("Alias") or v.get("Name"))
-            for _, ifs in om.GetManagedObjects().items()
-            if (v := ifs.get(DEVICE_INTERFACE)) and v.get("Paired", False)
+            for v in get_object_cache().devices()
+            if v.get("Paired", False)
         }
-        return self._encode(Msg.SUCCESS, paired or {"message": "No devices"})
+        self._paired_cache = self._encode(Msg.SUCCESS, paired or {"message": "No devices"})
+        return self._paired_cache
+
+    def _invalidate_paired(self, *_):
+        self._paired_cache = None
+
+    def _on_device_props_changed(self, _path, _iface, changed):
+        if "Paired" in changed or "Alias" in changed or "Name" in changed:
+            self._paired_cache = None
 
     def _handle_set_mute(self, data):
         mac = data.get("mac"); mute = data.get("mute")
         if mac is None or mute is None:
             return self._encode(Msg.ERROR, {"error": "Missing mac/mute"})
-        mac_fmt = mac.replace(":", "_")
-        proc = subprocess.run(["pactl", "list", "sinks", "short"], capture_output=True, text=True)
-        if proc.returncode != 0:
-            return self._encode(Msg.ERROR, {"error": "Cannot list sinks"})
-        sink_name = next((l.split()[1] for l in proc.stdout.splitlines() if mac_fmt in l), None)
-        if not sink_name:
-            return self._encode(Msg.ERROR, {"error": "sink not found"})
-        flag = "1" if mute else "0"
-        subprocess.run(["pactl", "set-sink-mute", sink_name, flag], check=True)
-        return self._encode(Msg.SUCCESS, {"mac": mac, "mute": mute})
+        if set_mute(mac, mute):
+            return self._encode(Msg.SUCCESS, {"mac": mac, "mute": mute})
+        return self._encode(Msg.ERROR, {"error": "mute failed"})
 
     def _unknown(self, _):
         return self._encode(Msg.ERROR, {"error": "Unknown message"})
     
     def _get_connected_speakers(self):
         """Return a list of {'mac':…, 'alias':…} for every Device1 with Connected=True."""
-        om = dbus.Interface(
-            self.bus.get_object(BLUEZ_SERVICE_NAME, "/"),
-            DBUS_OM_IFACE
-        )
         devices = []
-        for path, ifs in om.GetManagedObjects().items():
-            dev = ifs.get(DEVICE_INTERFACE)
-            if not dev or not dev.get("Connected", False):
+        for dev in get_object_cache().devices():
+            if not dev.get("Connected", False):
                 continue
             devices.append({
                 "mac":   dev.get("Address"),
@@ -257,18 +287,24 @@ class Characteristic(dbus.service.Object):
 
     
    
+    def _adapter_info(self):
+        """(path, MAC) of the RESERVED_HCI adapter, from the object cache.
+
+        A dict lookup, and unlike a memoised RPC it follows the dongle if it
+        is re-plugged.  KeyError if BlueZ does not export the adapter.
+        """
+        adapter = get_object_cache().get(self._adapter_path)[ADAPTER_INTERFACE]
+        return self._adapter_path, str(adapter["Address"])
+
     def _handle_scan_start(self, _):
         """Begin streaming scan: start BlueZ discovery on RESERVED_HCI."""
         # 1) find adapter path & MAC
-        hci = os.getenv("RESERVED_HCI")        # e.g. "hci3"
-        adapter_path = f"/org/bluez/{hci}"
         try:
-            obj = self.bus.get_object(BLUEZ_SERVICE_NAME, adapter_path)
-            props = dbus.Interface(obj, DBUS_PROP_IFACE)
-            adapter_mac = props.Get(ADAPTER_INTERFACE, "Address")
+            adapter_path, adapter_mac = self._adapter_info()
             if self.device_manager:
                 log.info("→ [SCAN_START] Found adapter %s (%s)", adapter_path, adapter_mac)
-                self._scan_mgr = ScanManager()
+                if self._scan_mgr is None:
+                    self._scan_mgr = ScanManager()
                 self._scan_mgr.ensure_discovery(adapter_mac)
                 self.device_manager.scanning = True
                 self._scan_adapter_mac = adapter_mac
@@ -296,8 +332,7 @@ class Characteristic(dbus.service.Object):
         
         if self.device_manager:
             self.device_manager.scanning = False
-        # clean up
-        self._scan_mgr = None
+        # clean up – keep the ScanManager around for the next scan
         self._scan_adapter_mac = None
 
         return self._encode(Msg.SUCCESS, {"scanning": False})
@@ -13,6 +13,12 @@ class ClientConfigDescriptor(dbus.service.Object):
         self.characteristic = characteristic
         # default notifications off
         self.value = [dbus.Byte(0), dbus.Byte(0)]
+        # property name → current value, built once
+        self._getters = {
+            "UUID": lambda: dbus.String(self.UUID),
+            "Characteristic": lambda: self.characteristic.get_path(),
+            "Value": lambda: dbus.Array(self.value, signature="y"),
+        }
 
     @dbus.service.method("org.bluez.GattDescriptor1", in_signature="aya{sv}")
     def WriteValue(self, value, options):
@@ -29,13 +35,8 @@ class ClientConfigDescriptor(dbus.service.Object):
 
     @dbus.service.method(DBUS_PROP_IFACE, in_signature="ss", out_signature="v")
     def Get(self, interface, prop):
-        if prop == "UUID":
-            return dbus.String(self.UUID)
-        if prop == "Characteristic":
-            return self.characteristic.get_path()
-        if prop == "Value":
-            return dbus.Array(self.value, signature="y")
-        return None
+        fn = self._getters.get(prop)
+        return fn() if fn else None
 
     @dbus.service.method(DBUS_PROP_IFACE, out_signature="a{sv}")
     def GetAll(self):
@@ -6,17 +6,26 @@ from gi.repository import GLib
 from typing import Dict, Set
 
 from ..logging_conf import get_logger
+from ..infra.bluez_cache import get_object_cache
+from ..infra.bus_manager import get_bus
 from ..constants import (
     BLUEZ_SERVICE_NAME,
-    DBUS_OM_IFACE, DBUS_PROP_IFACE,
-    DEVICE_INTERFACE, ADAPTER_INTERFACE,
+    DBUS_PROP_IFACE,
+    DEVICE_INTERFACE, ADAPTER_INTERFACE, MEDIA_TRANSPORT_INTERFACE, A2DP_UUID,
 )
-from ..utils.pulseaudio_service import create_loopback, remove_loopback_for_device
+from ..utils.pulseaudio_service import create_loopback, remove_loopback_for_device, sink_name_for
 from ..constants import Msg
 import re
 
 log = get_logger(__name__)
 
+# "/org/bluez/hciX/dev_AA_BB_…" → (adapter path, address).  BlueZ prints
+# addresses upper-case, so group 2 needs no re-casing.
+_DEV_PATH_RE = re.compile(r"^(/org/bluez/[^/]+)/dev_([0-9A-F_]{17})$")
+
+# Devices with no real name advertise one like "5C-A1-…"; hide those from scans.
+_MAC_LIKE_NAME = re.compile(r'([0-9A-F]{2}-){2,}', re.IGNORECASE)
+
 class DeviceManager:
     """Single source of truth for device state on one adapter."""
 
@@ -39,24 +48,17 @@ class DeviceManager:
     # ─────────────────────────── helpers ────────────────────────────────────
     @staticmethod
     def _extract_mac(path: str) -> str | None:
-        if "dev_" not in path:
-            return None
-        return path.split("/")[-1].replace("dev_", "").replace("_", ":").upper()
+        m = _DEV_PATH_RE.search(path)
+        return m.group(2).replace("_", ":") if m else None
 
     def _devices_on_adapter(self, adapter_prefix: str) -> list[str]:
         """Return MACs currently *Connected* under that adapter."""
-        om  = self.bus.get_object(BLUEZ_SERVICE_NAME, "/")
-        mgr = dbus.Interface(om, DBUS_OM_IFACE)
-        objs = mgr.GetManagedObjects()
-
-        result: list[str] = []
-        for obj_path, ifaces in objs.items():
-            dev = ifaces.get(DEVICE_INTERFACE)
-            if not dev or not dev.get("Connected", False):
-                continue
-            if obj_path.startswith(adapter_prefix):
-                result.append(dev["Address"])
-        return result
+        cache = get_object_cache()
+        return [
+            mac
+            for mac, path in cache.devices_on(adapter_prefix).items()
+            if cache.get(path).get(DEVICE_INTERFACE, {}).get("Connected", False)
+        ]
 
     # ───────────────────────── public API ───────────────────────────────────
     def attach_characteristic(self, char):
@@ -74,16 +76,17 @@ class DeviceManager:
             self._properties_changed,
             dbus_interface="org.freedesktop.DBus.Properties",
             signal_name="PropertiesChanged",
+            arg0=DEVICE_INTERFACE,
             path_keyword="path",
         )
 
     # D‑Bus callbacks --------------------------------------------------------
     def _interfaces_added(self, path, interfaces):
         if DEVICE_INTERFACE in interfaces:
-            self._device_found(path)
+            self._device_found(path, interfaces[DEVICE_INTERFACE])
 
     def _properties_changed(self, interface, changed, invalidated, path):
-        if interface != DEVICE_INTERFACE or "Connected" not in changed:
+        if "Connected" not in changed:    # arg0 match: always Device1
             return
 
         connected = bool(changed["Connected"])
@@ -115,31 +118,37 @@ class DeviceManager:
 
         
         # A2DP check ---------------------------------------------------------
-        try:
-            uuids = dev_props.Get(DEVICE_INTERFACE, "UUIDs")
-        except Exception:
-            uuids = []
+        # the object cache normally has UUIDs already; ask BlueZ only if not
+        uuids = get_object_cache().get(path).get(DEVICE_INTERFACE, {}).get("UUIDs")
+        if uuids is None:
+            try:
+                uuids = dev_props.Get(DEVICE_INTERFACE, "UUIDs")
+            except Exception:
+                uuids = []
         if not any("110b" in u.lower() for u in uuids):
             log.info("%s lacks A2DP – skipping", mac)
             return
 
-        adapter_prefix = "/".join(path.split("/")[:4])
+        adapter_prefix = _DEV_PATH_RE.search(path).group(1)
         others = [m for m in self._devices_on_adapter(adapter_prefix) if m != mac]
         if others:
             # another speaker already owns that controller
-            other_path = f"{adapter_prefix}/dev_{others[0].replace(':','_')}"
+            other_path = get_object_cache().device_path_on(adapter_prefix, others[0])
             dbus.Interface(dev_obj, DEVICE_INTERFACE).Disconnect()
             from syncsonic_ble.core.bt_helpers import remove_device_dbus
-            remove_device_dbus(other_path, self.bus)
+            # bt_helpers talks Gio directly – hand it the shared pydbus bus,
+            # not our dbus-python one
+            if other_path:      # None if BlueZ dropped it meanwhile
+                remove_device_dbus(other_path, get_bus())
             log.warning("%s tried adapter %s but %s is already there. Disconnecting and removing", mac, adapter_prefix, others[0])
             return
 
 
         # auto‑connect profile if transport missing --------------------------
-        _ensure_media_transport(self.bus, dev_obj, mac)
+        _ensure_media_transport(path, dev_obj, mac)
 
         # finally create loopback & mark connected ---------------------------
-        sink_name = f"bluez_sink.{mac.replace(':', '_')}.a2dp_sink"
+        sink_name = sink_name_for(mac)
         create_loopback(sink_name)
         self.connected.add(mac)
         log.info("Created loopback for %s", mac)
@@ -152,24 +161,23 @@ class DeviceManager:
         log.info("%s disconnected – %d speaker(s) left", mac, len(self.connected))
 
     # ───────────────────────── misc helpers ─────────────────────────────────
-    def _device_found(self, path: str):
+    def _device_found(self, path: str, dev: Dict):
         mac = self._extract_mac(path)
         if not mac:
             return
         # STREAMING SCAN MODE: broadcast each found device
         if self.scanning and self._char:
-            obj = self.bus.get_object(BLUEZ_SERVICE_NAME, path)
-            props = dbus.Interface(obj, DBUS_PROP_IFACE)
-            name = props.Get(DEVICE_INTERFACE, "Alias") or props.Get(DEVICE_INTERFACE, "Name")
-            paired = bool(props.Get(DEVICE_INTERFACE, "Paired"))
+            # InterfacesAdded carries the full Device1 property set
+            name = dev.get("Alias") or dev.get("Name", "")
+            paired = bool(dev.get("Paired", False))
             device_info = {"mac": mac, "name": name, "paired": paired}
-            log.info("→ [SCAN STREAM] Discovered %s (%s), paired=%s", name, mac, paired)
+            log.debug("→ [SCAN STREAM] Discovered %s (%s), paired=%s", name, mac, paired)
     
-            if re.search(r'([0-9A-F]{2}-){2,}', name, re.IGNORECASE):
-                log.info(f"Filtering out device: {name}")
+            if _MAC_LIKE_NAME.search(name):
+                log.debug("Filtering out device: %s", name)
             else:
                 self._char.send_notification(Msg.SCAN_DEVICES, {"device": device_info})
-                log.info(f"Adding device: {mac} with name: {name}")
+                log.debug("Adding device: %s with name: %s", mac, name)
             return
         # NORMAL mode: only expected speakers
         if mac.upper() not in self.connected:
@@ -183,20 +191,14 @@ class DeviceManager:
 
 # helper – ensure MediaTransport exists before we create loopback ------------
 
-def _ensure_media_transport(bus: dbus.SystemBus, dev_obj, mac: str):
-    from ..constants import DBUS_OM_IFACE
-    om  = bus.get_object(BLUEZ_SERVICE_NAME, "/")
-    mgr = dbus.Interface(om, DBUS_OM_IFACE)
-    objs = mgr.GetManagedObjects()
-    fmt = mac.replace(":", "_")
-    has_transport = any(
-        "org.bluez.MediaTransport1" in ifaces and fmt in path
-        for path, ifaces in objs.items()
-    )
-    if not has_transport:
-        try:
-            dbus_iface = dbus.Interface(dev_obj, DEVICE_INTERFACE)
-            dbus_iface.ConnectProfile("0000110b-0000-1000-8000-00805f9b34fb")
-            log.info("Triggered A2DP ConnectProfile for %s", mac)
-        except Exception as exc:
-            log.error("ConnectProfile failed for %s: %s", mac, exc)
\ No newline at end of file
+def _ensure_media_transport(path: str, dev_obj, mac: str):
+    # the shared object cache already mirrors MediaTransport1 objects, so
+    # no GetManagedObjects round trip on the GLib thread
+    if get_object_cache().has_iface_below(path, MEDIA_TRANSPORT_INTERFACE):
+        return
+    try:
+        dbus_iface = dbus.Interface(dev_obj, DEVICE_INTERFACE)
+        dbus_iface.ConnectProfile(A2DP_UUID)
+        log.info("Triggered A2DP ConnectProfile for %s", mac)
+    except Exception as exc:
+        log.error("ConnectProfile failed for %s: %s", mac, exc)
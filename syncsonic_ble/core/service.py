@@ -15,37 +15,39 @@ class GattService(dbus.service.Object):
         self.uuid            = uuid
         self.primary         = primary
         self.characteristics = []
+        self._obj_path       = dbus.ObjectPath(self.path)
+        # org.bluez.GattService1 properties, kept current by add_characteristic
+        self._props = {
+            "UUID":        dbus.String(uuid),
+            "Primary":     dbus.Boolean(primary),
+            "Characteristics": dbus.Array([], signature="o"),
+        }
+        self._iface_props = {GATT_SERVICE_IFACE: self._props}
         super().__init__(bus, self.path)
-        log.info(f"GattService created at {self.path} (UUID={uuid})")
+        log.info("GattService created at %s (UUID=%s)", self.path, uuid)
 
     def get_path(self) -> dbus.ObjectPath:
-        return dbus.ObjectPath(self.path)
+        return self._obj_path
 
     def add_characteristic(self, ch: dbus.service.Object) -> None:
         self.characteristics.append(ch)
+        self._props["Characteristics"] = dbus.Array(
+            [c.get_path() for c in self.characteristics], signature="o")
 
     def get_properties(self) -> dict:
         # Returns the org.bluez.GattService1 properties dict
-        char_paths = dbus.Array([c.get_path() for c in self.characteristics],
-                                signature="o")
-        return {
-            GATT_SERVICE_IFACE: {
-                "UUID":        self.uuid,
-                "Primary":     dbus.Boolean(self.primary),
-                "Characteristics": char_paths,
-            }
-        }
+        return self._iface_props
 
     # Expose properties via org.freedesktop.DBus.Properties
     @dbus.service.method(DBUS_PROP_IFACE,
                          in_signature="ss", out_signature="v")
     def Get(self, interface: str, prop: str) -> "v":
-        return self.get_properties()[interface][prop]
+        return self._iface_props[interface][prop]
 
     @dbus.service.method(DBUS_PROP_IFACE,
                          in_signature="s", out_signature="a{sv}")
     def GetAll(self, interface: str) -> dict:
-        return self.get_properties()[interface]
+        return self._iface_props[interface]
     
     
 
@@ -53,28 +55,28 @@ class Application(dbus.service.Object):
     def __init__(self, bus):
         self.path = '/com/syncsonic/app'
         self.services = []
+        # GetManagedObjects reply, filled in as services are added.  Services
+        # are fully assembled before add_service(); characteristic property
+        # dicts are live, so Value/Notifying never go stale in here.
+        self._managed: dict[str, dict] = {}
+        self._obj_path = dbus.ObjectPath(self.path)
         super().__init__(bus, self.path)
 
     def add_service(self, service):
         self.services.append(service)
+        # 1) service node
+        self._managed[service.get_path()] = service.get_properties()
+        for chrc in service.characteristics:
+            # 2) characteristic node
+            self._managed[chrc.get_path()] = chrc.get_properties()
+
+            # 3) any descriptors under that characteristic
+            for desc in getattr(chrc, 'descriptors', []):
+                self._managed[desc.get_path()] = desc.get_properties()
 
     def get_path(self) -> dbus.ObjectPath:
-        return dbus.ObjectPath(self.path)
+        return self._obj_path
 
     @dbus.service.method(DBUS_OM_IFACE, out_signature="a{oa{sa{sv}}}")
     def GetManagedObjects(self):
-        reply: dict[str, dict] = {}
-
-        for svc in self.services:
-            # 1) service node
-            reply[svc.get_path()] = svc.get_properties()
-
-            for chrc in svc.characteristics:
-                # 2) characteristic node
-                reply[chrc.get_path()] = chrc.get_properties()
-
-                # 3) any descriptors under that characteristic
-                for desc in getattr(chrc, 'descriptors', []):
-                    reply[desc.get_path()] = desc.get_properties()
-
-        return reply
+        return self._managed
@@ -1,24 +1,91 @@
-from flask import request, jsonify
-import subprocess
+from gi.repository import GLib
+from ..logging_conf import get_logger
+from ..utils.pulseaudio_service import pactl, pactl_output, sink_name_for
 
+log = get_logger(__name__)
 
+# Volume writes arriving within this window are coalesced per sink
+_VOLUME_FLUSH_MS = 20
+_pending: dict[str, tuple[int, int]] = {}   # sink name → latest (left, right)
+_flush_source = None                        # GLib source id while a flush is armed
 
-def set_stereo_volume(mac: str, balance: int, volume: int) -> bool:
+# mac_fmt → sink name found by listing, for sinks that don't use the
+# standard bluez_sink.<mac>.a2dp_sink name
+_listed_sinks: dict[str, str] = {}
+
+
+def _stereo_levels(balance: float, volume: int) -> tuple[int, int]:
     # Clamp balance to [0.0, 1.0]
     balance = max(0.0, min(1.0, balance))
 
-    # Compute left/right volumes based on balance
-    left = round(volume * (1 - balance) * 2) if balance >= 0.5 else volume
-    right = round(volume * balance * 2) if balance <= 0.5 else volume
+    # Compute left/right volumes based on balance: the quieter side scales
+    # down linearly from the centre, the other stays at full volume
+    left = round(volume * min(1.0, 2.0 * (1.0 - balance)))
+    right = round(volume * min(1.0, 2.0 * balance))
 
     # Optional: clamp to 0–150% to avoid out-of-bounds
     left = min(max(left, 0), 150)
     right = min(max(right, 0), 150)
-    sink_name = f"bluez_sink.{mac.replace(':', '_')}.a2dp_sink"
-    result = subprocess.run(
-        ["pactl", "set-sink-volume", sink_name, f"{left}%", f"{right}%"],
-        capture_output=True, text=True
-    )
- 
-
-    return result.returncode == 0, left, right
+    return left, right
+
+
+def _apply_volume(sink_name: str, left: int, right: int) -> bool:
+    # Always sent: the sink's level also changes behind our back (speaker
+    # buttons via A2DP absolute volume, reconnects), so a remembered value
+    # can't prove the request is a no-op.  Slider bursts are already
+    # coalesced by queue_stereo_volume.
+    return pactl("set-sink-volume", sink_name, f"{left}%", f"{right}%")
+
+
+def set_stereo_volume(mac: str, balance: int, volume: int) -> bool:
+    left, right = _stereo_levels(balance, volume)
+    return _apply_volume(sink_name_for(mac), left, right), left, right
+
+
+def queue_stereo_volume(mac: str, balance: float, volume: int) -> tuple[int, int]:
+    """Debounced set_stereo_volume for slider drags.
+
+    Records the target level and returns it straight away; a GLib timeout
+    applies only the latest level per sink once the burst settles.
+    Must be called from the GLib main loop thread.
+    """
+    global _flush_source
+    left, right = _stereo_levels(balance, volume)
+    _pending[sink_name_for(mac)] = (left, right)
+    if _flush_source is None:
+        _flush_source = GLib.timeout_add(_VOLUME_FLUSH_MS, _flush_pending)
+    return left, right
+
+
+def _flush_pending() -> bool:
+    global _flush_source
+    _flush_source = None
+    while _pending:
+        sink_name, (left, right) = _pending.popitem()
+        if not _apply_volume(sink_name, left, right):
+            log.warning("Volume change for %s failed", sink_name)
+    return False  # one-shot
+
+
+def set_mute(mac: str, mute: bool) -> bool:
+    """Mute/unmute the sink belonging to *mac*.
+
+    Tries the known sink name first; only lists sinks when that fails.
+    """
+    mac_fmt = mac.replace(":", "_")
+    flag = "1" if mute else "0"
+    sink_name = _listed_sinks.get(mac_fmt) or sink_name_for(mac)
+    if pactl("set-sink-mute", sink_name, flag):
+        return True
+
+    _listed_sinks.pop(mac_fmt, None)
+    proc = pactl_output("list", "sinks", "short")
+    if proc.returncode != 0:
+        return False
+    sink_name = next((l.split()[1] for l in proc.stdout.splitlines() if mac_fmt in l), None)
+    if not sink_name:
+        return False
+    if not pactl("set-sink-mute", sink_name, flag):
+        return False
+    _listed_sinks[mac_fmt] = sink_name
+    return True
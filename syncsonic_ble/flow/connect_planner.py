@@ -1,3 +1,4 @@
+from typing import Iterable
 from ..logging_conf import get_logger
 import os
 logger = get_logger(__name__)
@@ -6,7 +7,9 @@ reserved = os.getenv("RESERVED_HCI")
 if not reserved:
     raise RuntimeError("RESERVED_HCI not set – cannot pick phone adapter")
 
-def connect_one_plan(target_mac: str, allowed_macs: list[str], objects: dict) -> tuple[str, str, list[tuple[str, str]]]:
+_reserved_path = f"/org/bluez/{reserved}"
+
+def connect_one_plan(target_mac: str, allowed_macs: Iterable[str], objects: dict) -> tuple[str, str, list[tuple[str, str]]]:
     """
     Determines the appropriate connection plan for a given target device:
     - If already connected correctly, returns 'already_connected'.
@@ -15,7 +18,7 @@ def connect_one_plan(target_mac: str, allowed_macs: list[str], objects: dict) ->
 
     Args:   
         target_mac (str): The MAC address of the target device.
-        allowed_macs (list[str]): The list of allowed speaker MACs.
+        allowed_macs (Iterable[str]): The allowed speaker MACs (any case).
         objects (dict): The D-Bus object tree from GetManagedObjects().
 
     Returns:
@@ -25,70 +28,65 @@ def connect_one_plan(target_mac: str, allowed_macs: list[str], objects: dict) ->
             - List of (device_mac, controller_mac) tuples to disconnect
     """
     target_mac = target_mac.upper()
-    allowed_macs = [mac.upper() for mac in allowed_macs]
+    allowed = frozenset(mac.upper() for mac in allowed_macs)
     disconnect_list = []
     target_connected_on = []
     config_speaker_usage = {}
     used_controllers = set()
-    adapters = {}
-
-    # Build a map of adapter MACs to their object paths
-    for path, ifaces in objects.items():
-        if "org.bluez.Adapter1" in ifaces:
-            addr = ifaces["org.bluez.Adapter1"].get("Address", "").upper()
-            hci_name = path.split("/")[-1]
-            if hci_name == reserved:
-                continue  # Skip reserved adapter
-            adapters[addr] = path
+    adapters = {}      # adapter object path → adapter MAC
+    devices = []       # (path, Device1 props), resolved once adapters are known
 
-    logger.info(f"Planning connection for target: {target_mac}")
-    logger.info(f"Allowed MACs in config: {allowed_macs}")
-
-    # Analyze all devices
+    # BlueZ always reports addresses upper-case, so only the caller-supplied
+    # MACs above need normalising.
+    # One pass: collect adapters (minus the reserved one) and buffer devices
     for path, ifaces in objects.items():
         dev = ifaces.get("org.bluez.Device1")
-        if not dev:
+        if dev:
+            devices.append((path, dev))
             continue
-        dev_mac = dev.get("Address", "").upper()
-        adapter_prefix = "/".join(path.split("/")[:4])
+        adapter = ifaces.get("org.bluez.Adapter1")
+        if adapter:
+            if path == _reserved_path:
+                continue  # Skip reserved adapter
+            adapters[path] = adapter.get("Address", "")
 
-        ctrl_mac = None
-        for mac, adapter_path in adapters.items():
-            if adapter_prefix == adapter_path:
-                ctrl_mac = mac
-                break
+    logger.info("Planning connection for target: %s", target_mac)
+    logger.debug("Allowed MACs in config: %s", allowed)
 
+    # Analyze all devices
+    for path, dev in devices:
+        ctrl_mac = adapters.get(path[:path.rfind("/")])
         if not ctrl_mac:
             continue  # This device does not belong to a recognized adapter
 
+        dev_mac = dev.get("Address", "")
         if dev.get("Connected", False):
-            logger.info(f"Found connected device: {dev_mac} on {ctrl_mac}")
+            logger.debug("Found connected device: %s on %s", dev_mac, ctrl_mac)
 
-            if dev_mac in allowed_macs:
+            if dev_mac in allowed:
                 config_speaker_usage.setdefault(dev_mac, []).append(ctrl_mac)
 
             if dev_mac == target_mac:
                 target_connected_on.append(ctrl_mac)
-                logger.info(f"Target {dev_mac} already connected on {ctrl_mac}")
+                logger.debug("Target %s already connected on %s", dev_mac, ctrl_mac)
 
-            elif dev_mac not in allowed_macs:
+            elif dev_mac not in allowed:
                 disconnect_list.append((dev_mac, ctrl_mac))
-                logger.info(f"Out-of-config device {dev_mac} → marked for disconnection")
+                logger.debug("Out-of-config device %s → marked for disconnection", dev_mac)
 
-            elif dev_mac in allowed_macs:
+            elif dev_mac in allowed:
                 used_controllers.add(ctrl_mac)
-                logger.info(f"Config speaker {dev_mac} occupies controller {ctrl_mac}")
+                logger.debug("Config speaker %s occupies controller %s", dev_mac, ctrl_mac)
 
-    logger.info(f"Target is currently connected on: {target_connected_on}")
-    logger.info(f"Disconnect list built: {disconnect_list}")
-    logger.info(f"Controllers in use by config devices: {used_controllers}")
+    logger.info("Target connected on %s; disconnect list %s; controllers in use %s",
+                target_connected_on, disconnect_list, used_controllers)
 
     # Handle multiple connections of target
     if len(target_connected_on) > 1:
         controller_to_keep = target_connected_on[0]
         for ctrl_mac in target_connected_on[1:]:
             disconnect_list.append((target_mac, ctrl_mac))
-        logger.info(f"Target connected on multiple controllers, keeping {controller_to_keep}, disconnecting others")
+        logger.info("Target connected on multiple controllers, keeping %s, disconnecting others", controller_to_keep)
         return "already_connected", controller_to_keep, disconnect_list
 
     # Target connected once: ensure it's not sharing with another config speaker
@@ -97,12 +95,12 @@ def connect_one_plan(target_mac: str, allowed_macs: list[str], objects: dict) ->
         for mac, controllers in config_speaker_usage.items():
             if mac != target_mac and controller in controllers:
                 disconnect_list.append((target_mac, controller))
-                logger.info(f"Target {target_mac} shares controller {controller} with config speaker {mac}, reallocating")
+                logger.info("Target %s shares controller %s with config speaker %s, reallocating", target_mac, controller, mac)
 
                 # Try to find a free controller
-                for new_ctrl_mac in adapters:
+                for new_ctrl_mac in adapters.values():
                     if new_ctrl_mac not in used_controllers and new_ctrl_mac != controller:
-                        logger.info(f"Assigning free controller {new_ctrl_mac} to target {target_mac}")
+                        logger.info("Assigning free controller %s to target %s", new_ctrl_mac, target_mac)
                         return "needs_connection", new_ctrl_mac, disconnect_list
 
                 # Fallback: free a duplicate
@@ -110,26 +108,26 @@ def connect_one_plan(target_mac: str, allowed_macs: list[str], objects: dict) ->
                     if len(controllers2) > 1:
                         ctrl_to_free = controllers2[1]
                         disconnect_list.append((mac2, ctrl_to_free))
-                        logger.info(f"Freeing {ctrl_to_free} from {mac2} to connect target {target_mac}")
+                        logger.info("Freeing %s from %s to connect target %s", ctrl_to_free, mac2, target_mac)
                         return "needs_connection", ctrl_to_free, disconnect_list
 
-                logger.info(f"No controller available after rebalance for target {target_mac}")
+                logger.info("No controller available after rebalance for target %s", target_mac)
                 return "error", "", disconnect_list
 
         return "already_connected", controller, disconnect_list
 
     # Target is not currently connected anywhere
-    for ctrl_mac in adapters:
+    for ctrl_mac in adapters.values():
         if ctrl_mac not in used_controllers:
-            logger.info(f"Free controller {ctrl_mac} found for target {target_mac}")
+            logger.info("Free controller %s found for target %s", ctrl_mac, target_mac)
             return "needs_connection", ctrl_mac, disconnect_list
 
     for mac, controllers in config_speaker_usage.items():
         if len(controllers) > 1:
             ctrl_to_free = controllers[1]
             disconnect_list.append((mac, ctrl_to_free))
-            logger.info(f"Freeing controller {ctrl_to_free} from {mac} to connect target {target_mac}")
+            logger.info("Freeing controller %s from %s to connect target %s", ctrl_to_free, mac, target_mac)
             return "needs_connection", ctrl_to_free, disconnect_list
 
-    logger.info(f"No available controller found for target {target_mac}")
+    logger.info("No available controller found for target %s", target_mac)
     return "error", "", disconnect_list
\ No newline at end of file
@@ -6,37 +6,64 @@ Thread‑safe orchestrator that owns **all** Bluetooth logic:
 * Maintains the *expected speaker* set.
 * Uses :pyclass:`scan_manager.ScanManager` to serialise discovery.
 * Runs **one** background worker thread that consumes intents from a
-  `queue.Queue` – so every BlueZ call happens in that single thread.
+  `collections.deque` – so every BlueZ call happens in that single thread.
 * Can be driven by any transport: Flask today, BLE tomorrow.
 """
 
 from __future__ import annotations
 
+import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from queue import Queue, Empty
+from collections import Counter, OrderedDict, deque
 from typing import Dict, List, Tuple
 
 from syncsonic_ble.infra.bus_manager import get_bus
+from syncsonic_ble.infra.bluez_cache import get_object_cache
 from syncsonic_ble.flow.scan_manager import ScanManager
 from syncsonic_ble.flow.connect_planner import connect_one_plan  # rename of your existing file
 from syncsonic_ble.core.bt_helpers import (                      # thin wrappers around DBus ops
     disconnect_device_dbus,
     connect_device_dbus,
-    pair_device_dbus,
+    pair_and_trust_dbus,
     trust_device_dbus,
     remove_device_dbus,
 )
-from ..utils.pulseaudio_service import create_loopback, remove_loopback_for_device, setup_pulseaudio
+from ..utils.pulseaudio_service import (create_loopbacks, remove_loopback_for_device,
+                                        setup_pulseaudio, sink_name_for)
 from ..logging_conf import get_logger
 import subprocess, time
-from ..constants import (Msg, DBUS_PROP_IFACE, DEVICE_INTERFACE, ADAPTER_INTERFACE, BLUEZ_SERVICE_NAME)
-from ..core.characteristic import Characteristic
-from dbus import Interface
+from ..constants import (Msg, DEVICE_INTERFACE, ADAPTER_INTERFACE, BLUEZ_SERVICE_NAME,
+                         MEDIA_TRANSPORT_INTERFACE, A2DP_UUID)
 logger = get_logger(__name__)
 
+# Upper bound on waiting for the controller to leave discovery before
+# pairing; only needed when the device was just (re)discovered.
+_POST_DISCOVERY_SETTLE_S = 1.5
+
+# Connected can flap several times during re-link / role switch; only the
+# state that survives this window is turned into a LOOPBACK_SYNC.
+_LOOPBACK_DEBOUNCE_S = 0.25
+
+# BlueZ device object path tail; BlueZ always prints the address in upper
+# case, so a match is already normalised.  Anchored so that child objects
+# (…/dev_XX/sep1/fd0) do not match.
+_DEV_RE = re.compile(r"/dev_([0-9A-F_]{17})$")
+
+# Profiles that make a device a usable speaker.  BlueZ reports UUIDs in
+# canonical lower-case form, so plain membership is enough.  Only the A2DP
+# sink (110b) – matching the old "110b" test; A2DP source (110a) is a phone.
+_AUDIO_UUIDS = frozenset((A2DP_UUID,))
+
+_MAC_TRANS = str.maketrans(":", "_")
+
+
+# pydbus introspects on every bus.get(); keep this many interface proxies
+_IFACE_CACHE_MAX = 256
+
 # ---------------------------------------------------------------------------
-# Public intent enum + shared queue
+# Public intent enum
 # ---------------------------------------------------------------------------
 
 class Intent(Enum):
@@ -46,8 +73,6 @@ class Intent(Enum):
     LOOPBACK_SYNC = auto()  # expects key: {"mac": <str>, "connected": <bool>}
 
 
-work_q: Queue[Tuple[Intent, Dict]] = Queue()  # one global queue
-
 # ---------------------------------------------------------------------------
 # ConnectionService implementation
 # ---------------------------------------------------------------------------
@@ -61,18 +86,47 @@ class ConnectionService:
         self.bus  = get_bus()          # singleton, thread‑safe
         self.scan = ScanManager()      # owns discovery
 
-        self.bus.subscribe(
-            iface="org.freedesktop.DBus.Properties",
-            signal="PropertiesChanged",
-            object="/org/bluez",
-            signal_fired=self._on_props_changed,
-        )
-
+        # Shared mirror of BlueZ's object tree – the worker never has to
+        # call GetManagedObjects.  Proxies and device paths are cached here
+        # and dropped when BlueZ removes the object.
+        self.objects = get_object_cache()
+        self._objects_lock = threading.Lock()
+        self._path_for: Dict[Tuple[str, str], str] = {}  # (ctrl, dev) → device path
+        self._iface_cache: OrderedDict[Tuple[str, str], object] = OrderedDict()
+        self.objects.on_removed(self._on_ifaces_removed)
+        self.objects.on_props_changed(self._on_props_changed)
+
+        # upper-case MACs only – every writer normalises on insert, so the
+        # signal handler can test membership without re-casing
         self.expected: set[str] = set()
-        self.loopbacks: set[str] = set()  # macs that already have loopbacks
+        # macs that have (or are queued to get) a loopback; updated when the
+        # PulseAudio op is queued so duplicate intents are dropped early
+        self.loopbacks: set[str] = set()
+
+        # intent queue: deque append/popleft are atomic, so submitters never
+        # contend on a lock; the Event only wakes the worker
+        self._q: deque[Tuple[Intent, Dict]] = deque()
+        self._wake = threading.Event()
+
+        # per-MAC debounce of Connected flips → LOOPBACK_SYNC
+        self._loopback_lock = threading.Lock()
+        self._pending_loopback: Dict[str, bool] = {}
+        self._loopback_timers: Dict[str, threading.Timer] = {}
+
+        # PulseAudio ops (pactl, can take seconds while a sink appears) run on
+        # their own thread so they never hold up BlueZ intents
+        self._pa_q: deque[Tuple[bool, str, bool]] = deque()
+        self._pa_wake = threading.Event()
+        # queued-op count per MAC, kept in step with _pa_q under _pa_lock so
+        # the worker can ask "is something newer queued?" without iterating
+        # a deque the BlueZ worker is appending to
+        self._pa_lock = threading.Lock()
+        self._pa_pending: Counter[str] = Counter()
 
         self._worker = threading.Thread(target=self._run_worker, daemon=True)
         self._worker.start()
+        self._pa_worker = threading.Thread(target=self._run_pa_worker, daemon=True)
+        self._pa_worker.start()
         self._char = None  # will be injected later
         logger.info("ConnectionService worker thread started")
 
@@ -82,7 +136,8 @@ class ConnectionService:
 
     def submit(self, intent: Intent, payload: Dict):
         """Called by *any* transport thread (Flask / BLE etc.)."""
-        work_q.put((intent, payload))
+        self._q.append((intent, payload))
+        self._wake.set()
 
     # ------------------------------------------------------------------
     #  BlueZ signal helpers
@@ -90,8 +145,8 @@ class ConnectionService:
     #  • _extract_mac(path)       – pull “AA:BB:CC:DD:EE:FF” out of a
     #    BlueZ object path like “…/dev_AA_BB_CC_DD_EE_FF”.
     #
-    #  • _on_props_changed(...)   – runs in the GLib thread whenever
-    #    BlueZ fires PropertiesChanged.  If the signal toggles the
+    #  • _on_props_changed(...)   – called from the object cache (GLib
+    #    thread) for every Device1/Adapter1 PropertiesChanged.  If the signal toggles the
     #    Connected flag for one of our *expected* speakers, we enqueue a
     #    LOOPBACK_SYNC intent so the worker thread can create/remove the
     #    loopback safely and in order.
@@ -99,136 +154,227 @@ class ConnectionService:
 
     @staticmethod
     def _extract_mac(path: str) -> str | None:
-        if "dev_" not in path:
-            return None
-        return path.split("/")[-1].replace("dev_", "").replace("_", ":").upper()
-
-    def _on_props_changed(self, sender, obj_path, iface, signal, params):
-        #logger.info(f"PROP signal {mac} Connected={connected}")
-
-        # Params is a GLib Variant → unpack to tuple
-        changed_iface, changed_dict, _invalidated = params
-
-        # We only care about Device1 property changes
-        if changed_iface != "org.bluez.Device1":
+        m = _DEV_RE.search(path)
+        return m.group(1).replace("_", ":") if m else None
+
+    def _iface(self, path: str, iface_name: str):
+        """Return a (cached) pydbus proxy for *iface_name* on *path*."""
+        key = (path, iface_name)
+        with self._objects_lock:
+            proxy = self._iface_cache.get(key)
+            if proxy is not None:
+                self._iface_cache.move_to_end(key)
+                return proxy
+        proxy = self.bus.get(BLUEZ_SERVICE_NAME, path)[iface_name]
+        with self._objects_lock:
+            self._iface_cache[key] = proxy
+            if len(self._iface_cache) > _IFACE_CACHE_MAX:
+                self._iface_cache.popitem(last=False)
+        return proxy
+
+    def _on_ifaces_removed(self, path: str, ifaces: List[str]):
+        with self._objects_lock:
+            for name in ifaces:
+                self._iface_cache.pop((path, name), None)
+            if ADAPTER_INTERFACE in ifaces:
+                # hciX can be renumbered after a reset – forget its paths
+                prefix = path + "/"
+                self._path_for = {k: v for k, v in self._path_for.items()
+                                  if not v.startswith(prefix)}
+
+    def _on_props_changed(self, obj_path: str, iface: str, changed: Dict):
+        # The cache has already applied the change; we only care about
+        # Connected flips of expected speakers.
+        if "Connected" not in changed:
             return
 
+        # _extract_mac and self.expected are both upper-case already
         mac = self._extract_mac(obj_path)
-        if not mac or "Connected" not in changed_dict:
-            return
-        if mac.upper() not in self.expected:
+        if mac not in self.expected:
             return
 
-        connected = bool(changed_dict["Connected"])
-        work_q.put((
-            Intent.LOOPBACK_SYNC,
-            {"mac": mac.upper(), "connected": connected}
-        ))
-
+        timer = threading.Timer(_LOOPBACK_DEBOUNCE_S, self._flush_loopback, args=(mac,))
+        timer.daemon = True
+        with self._loopback_lock:
+            self._pending_loopback[mac] = bool(changed["Connected"])
+            previous = self._loopback_timers.get(mac)
+            if previous:
+                previous.cancel()
+            self._loopback_timers[mac] = timer
+        timer.start()
+
+    def _flush_loopback(self, mac: str):
+        with self._loopback_lock:
+            if self._loopback_timers.get(mac) is not threading.current_thread():
+                return  # superseded by a later flip
+            del self._loopback_timers[mac]
+            connected = self._pending_loopback.pop(mac)
+        # racy fast filter – the worker re-checks authoritatively – but it
+        # drops duplicate Connected=True/False without a queue hop
+        if connected == (mac in self.loopbacks):
+            return
+        self.submit(Intent.LOOPBACK_SYNC, {"mac": mac, "connected": connected})
 
     # -----------------------------
     # Worker loop (runs in its own thread)
     # -----------------------------
 
-    def _run_worker(self):  # noqa: C901 – complexity is okay for now
+    def _run_worker(self):
+        while True:
+            # clear before draining: a submit() racing with the drain
+            # re-sets the event, so nothing is ever left behind
+            self._wake.wait()
+            self._wake.clear()
+            while self._q:
+                intent, payload = self._q.popleft()
+                self._handle(intent, payload)
+
+    def _queue_loopback(self, mac: str, create: bool, notify: bool = False):
+        """Hand a loopback create/remove for *mac* to the PulseAudio worker."""
+        if create:
+            self.loopbacks.add(mac)
+        else:
+            self.loopbacks.discard(mac)
+        with self._pa_lock:
+            self._pa_q.append((create, mac, notify))
+            self._pa_pending[mac] += 1
+        self._pa_wake.set()
+
+    def _take_pa_batch(self) -> Tuple[bool, List[Tuple[str, bool]]] | None:
+        """Pop the next op – plus any creates right behind a create."""
+        with self._pa_lock:
+            if not self._pa_q:
+                return None
+            create, mac, notify = self._pa_q.popleft()
+            batch = [(mac, notify)]
+            # speakers connecting together queue creates back to back; set
+            # them all up with one sink wait and one module listing
+            while create and self._pa_q and self._pa_q[0][0] is True:
+                _, mac, notify = self._pa_q.popleft()
+                batch.append((mac, notify))
+            for mac, _ in batch:
+                self._pa_pending[mac] -= 1
+                if not self._pa_pending[mac]:
+                    del self._pa_pending[mac]
+            return create, batch
+
+    def _run_pa_worker(self):
         while True:
-            try:
-                intent, payload = work_q.get(timeout=1)
-            except Empty:
+            self._pa_wake.wait()
+            self._pa_wake.clear()
+            while (op := self._take_pa_batch()) is not None:
+                create, batch = op
+                # one bad op must not take the thread (and every later
+                # loopback) down with it
+                try:
+                    if create:
+                        self._create_loopbacks(batch)
+                    else:
+                        remove_loopback_for_device(batch[0][0])
+                        logger.info("🗑️  Loopback removed for %s", batch[0][0])
+                except Exception:
+                    logger.exception("Loopback %s failed for %s",
+                                     "creation" if create else "removal",
+                                     ", ".join(m for m, _ in batch))
+
+    def _create_loopbacks(self, batch: List[Tuple[str, bool]]):
+        try:
+            created = create_loopbacks([sink_name_for(m) for m, _ in batch])
+        except Exception:
+            logger.exception("Loopback creation failed")
+            created = {}
+
+        for mac, notify in batch:
+            if created.get(sink_name_for(mac)):
+                logger.info("✅ Loopback created for %s", mac)
                 continue
-            
+            logger.info("⚠️ Loopback creation failed for %s", mac)
+            # keep the optimistic entry if a newer op is already queued
+            with self._pa_lock:
+                superseded = mac in self._pa_pending
+            if not superseded:
+                self.loopbacks.discard(mac)
+            if notify and self._char:
+                self._char.send_notification(
+                    Msg.ERROR,
+                    {"phase": "loopback creation failed, click connect again", "device": mac}
+                )
 
-            if intent is Intent.SET_EXPECTED:
-                macs: List[str] = [m.upper() for m in payload["macs"]]
-                replace: bool = payload.get("replace", False)
-                if replace:
-                    self.expected = set(macs)
-                else:
-                    self.expected.update(macs)
-                logger.info(f"Expected set now {self.expected}")
+    def _handle(self, intent: Intent, payload: Dict):  # noqa: C901 – complexity is okay for now
+        if intent is Intent.SET_EXPECTED:
+            macs: List[str] = [m.upper() for m in payload["macs"]]
+            replace: bool = payload.get("replace", False)
+            if replace:
+                self.expected = set(macs)
+            else:
+                self.expected.update(macs)
+            logger.info("Expected set now %s", self.expected)
 
-            elif intent is Intent.CONNECT_ONE:
-                mac   = payload["mac"].upper()
-                allow = [m.upper() for m in payload["allowed"]]
+        elif intent is Intent.CONNECT_ONE:
+            mac   = payload["mac"].upper()
+            allow = payload["allowed"]      # planner normalises into a frozenset
 
-                self.expected.add(mac)          # so loopback sync recognises it
+            self.expected.add(mac)          # so loopback sync recognises it
 
 
 
-                # # Re‑evaluate object tree each time
+            # # Re‑evaluate object tree each time
 
-                obj_mgr = self.bus.get("org.bluez", "/").GetManagedObjects()
-                status, ctrl_mac, dc_list = connect_one_plan(mac, allow, obj_mgr)
+            obj_mgr = self.objects.snapshot()
+            status, ctrl_mac, dc_list = connect_one_plan(mac, allow, obj_mgr)
 
-                
 
-                for dev_mac, adapter_mac in dc_list:
-                    path = self._device_path(adapter_mac, dev_mac)
-                    disconnect_device_dbus(path, dev_mac, self.bus)
-                
-                if status == "already_connected":
-                    sink = f"bluez_sink.{mac.replace(':', '_')}.a2dp_sink"
-                    A2DP_UUID = "0000110b-0000-1000-8000-00805f9b34fb"
-                    # use ctrl_mac (the HCI) and mac (the device) instead
-                    device_path = self._device_path(ctrl_mac, mac)
-                    raw_obj     = self.bus.get(BLUEZ_SERVICE_NAME, device_path)
-                    dev_iface   = Interface(raw_obj, DEVICE_INTERFACE)
 
-                    logger.info(f"→ [DEBUG] Asking BlueZ to connect A2DP on {device_path}")
-                    try:
-                        dev_iface.ConnectProfile(A2DP_UUID)
-                        logger.info("→ [DEBUG] ConnectProfile(A2DP) succeeded")
-                    except Exception as e:
-                        logger.info(f"⚠️ ConnectProfile(A2DP) failed: {e}")
-                                    
+            self._disconnect_many([
+                (self._device_path(adapter_mac, dev_mac), dev_mac)
+                for dev_mac, adapter_mac in dc_list
+            ])
 
-                     # signal connect success
-                    if self._char:
-                        self._char.send_notification(
-                            Msg.CONNECTION_STATUS_UPDATE,
-                            {"phase": "connect_success", "device": mac}
-                        )
+            if status == "already_connected":
+                # use ctrl_mac (the HCI) and mac (the device) instead
+                device_path = self._device_path(ctrl_mac, mac)
+                self._ensure_a2dp(device_path)
+
+
+                 # signal connect success
+                if self._char:
+                    self._char.send_notification(
+                        Msg.CONNECTION_STATUS_UPDATE,
+                        {"phase": "connect_success", "device": mac}
+                    )
 
-                    if mac not in self.loopbacks:
-                        if create_loopback(sink):
-                            self.loopbacks.add(mac)
-                            logger.info(f"✅ Loopback created for already-connected {mac}")
-                    # we’re done; nothing else to do for this intent
-                    continue
+                if mac not in self.loopbacks:
+                    self._queue_loopback(mac, create=True)
+                # we’re done; nothing else to do for this intent
+                return
 
-                if status == "needs_connection" and ctrl_mac:
-                    self._try_reconnect(ctrl_mac, mac)
+            if status == "needs_connection" and ctrl_mac:
+                self._try_reconnect(ctrl_mac, mac, objects=obj_mgr)
 
-            elif intent is Intent.DISCONNECT:
-                mac = payload["mac"].upper()
-                self._disconnect_everywhere(mac)
+        elif intent is Intent.DISCONNECT:
+            mac = payload["mac"].upper()
+            self._disconnect_everywhere(mac)
 
-            elif intent is Intent.LOOPBACK_SYNC:
-                mac        = payload["mac"]
-                connected  = payload["connected"]
-                sink       = f"bluez_sink.{mac.replace(':', '_')}.a2dp_sink"
+        elif intent is Intent.LOOPBACK_SYNC:
+            mac        = payload["mac"]
+            connected  = payload["connected"]
 
-                if connected and mac not in self.loopbacks:
-                    if create_loopback(sink):
-                        self.loopbacks.add(mac)
-                        logger.info(f"✅ Loopback autoprovisioned for {mac}")
-                elif not connected and mac in self.loopbacks:
-                    remove_loopback_for_device(mac)
-                    self.loopbacks.remove(mac)
-                    logger.info(f"🗑️  Loopback removed after disconnect for {mac}")
+            if connected and mac not in self.loopbacks:
+                self._queue_loopback(mac, create=True)
+            elif not connected and mac in self.loopbacks:
+                self._queue_loopback(mac, create=False)
 
 
     # -----------------------------
     # Core helpers (same thread)
     # -----------------------------
 
-    def _try_reconnect(self, adapter_mac: str, dev_mac: str):
-        logger.info(f"FSM: reconnect {dev_mac} via {adapter_mac}")
+    def _try_reconnect(self, adapter_mac: str, dev_mac: str, objects: Dict | None = None):
+        logger.info("FSM: reconnect %s via %s", dev_mac, adapter_mac)
 
         # NEW → ask the object tree what still needs doing
-        state = self._analyze_device(adapter_mac, dev_mac)
+        state = self._analyze_device(adapter_mac, dev_mac, objects=objects)
 
-        loopback_sink = f"bluez_sink.{dev_mac.replace(':', '_')}.a2dp_sink"
         device_path = self._device_path(adapter_mac, dev_mac)
         max_retry = 3
         attempt   = 0
@@ -239,7 +385,7 @@ class ConnectionService:
                 {"phase": "fsm_start", "device": dev_mac}
             )
         while attempt < max_retry:
-            logger.info(f"  → [{attempt+1}/3] state={state}")
+            logger.info("  → [%s/3] state=%s", attempt+1, state)
             if self._char:
                 self._char.send_notification(
                     Msg.CONNECTION_STATUS_UPDATE,
@@ -281,7 +427,13 @@ class ConnectionService:
                         {"phase": "discovery_complete", "device": dev_mac}
                     )
                 device_path = path
-                state = "pair"   
+                # StopDiscovery returns before the controller has left the
+                # inquiry state; BlueZ reports that via Discovering=False
+                self.objects.wait_for_property(
+                    self.objects.adapter_path(adapter_mac), ADAPTER_INTERFACE,
+                    "Discovering", False, timeout=_POST_DISCOVERY_SETTLE_S,
+                )
+                state = "pair"
 
             elif state == "pair":
                 # signal pairing start
@@ -290,14 +442,19 @@ class ConnectionService:
                         Msg.CONNECTION_STATUS_UPDATE,
                         {"phase": "pairing_start", "device": dev_mac}
                     )
-                if pair_device_dbus(device_path, bus=self.bus):
-                    state = "trust"
+                # Trusted is pipelined with Pair(), so go straight to connect
+                if pair_and_trust_dbus(device_path, bus=self.bus):
+                    state = "connect"
                     # signal pairing success
                     if self._char:
                         self._char.send_notification(
                             Msg.CONNECTION_STATUS_UPDATE,
                             {"phase": "pairing_success", "device": dev_mac}
                         )
+                        self._char.send_notification(
+                            Msg.CONNECTION_STATUS_UPDATE,
+                            {"phase": "trusting", "device": dev_mac}
+                        )
                 else:
                     attempt += 1
                     remove_device_dbus(device_path, self.bus)
@@ -331,20 +488,7 @@ class ConnectionService:
                 if connect_device_dbus(device_path, self.bus):
 
                     device_path = self._device_path(adapter_mac, dev_mac)
-                    raw_obj     = self.bus.get(BLUEZ_SERVICE_NAME, device_path)
-
-                    # wrap it in the Device1 interface
-                    dev_iface   = Interface(raw_obj, DEVICE_INTERFACE)
-
-                    # A2DP Sink UUID
-                    A2DP_UUID    = "0000110b-0000-1000-8000-00805f9b34fb"
-
-                    logger.info(f"→ [DEBUG] Asking BlueZ to connect A2DP on {device_path}")
-                    try:
-                        dev_iface.ConnectProfile(A2DP_UUID)
-                        logger.info("→ [DEBUG] ConnectProfile(A2DP) succeeded")
-                    except Exception as e:
-                        logger.info(f"⚠️ ConnectProfile(A2DP) failed: {e}")
+                    self._ensure_a2dp(device_path)
 
                     # signal connect success
                     if self._char:
@@ -352,18 +496,10 @@ class ConnectionService:
                             Msg.CONNECTION_STATUS_UPDATE,
                             {"phase": "connect_success", "device": dev_mac}
                         )
-                    if create_loopback(loopback_sink):
-                        self.loopbacks.add(dev_mac)
-                        logger.info("    ✅ connected + loopback")
-                        return
-                    else:
-                        logger.info("    ⚠️ connected but loopback creation failed")
-                        if self._char:
-                            self._char.send_notification(
-                                Msg.ERROR,
-                                {"phase": "loopback creation failed, click connect again", "device": dev_mac}
-                            )
-                        return
+                    # the PA worker reports a failed loopback to the app
+                    self._queue_loopback(dev_mac, create=True, notify=True)
+                    logger.info("    ✅ connected, loopback queued")
+                    return
                     
                 if self._char:
                     self._char.send_notification(
@@ -374,20 +510,53 @@ class ConnectionService:
                 state = "pair"  # fall back
                 attempt += 1
 
-        logger.info(f"    ❌ failed to reconnect {dev_mac}")
+        logger.info("    ❌ failed to reconnect %s", dev_mac)
+
+    def _ensure_a2dp(self, device_path: str):
+        """Ask BlueZ for the A2DP profile unless a MediaTransport1 is already up."""
+        if self.objects.has_iface_below(device_path, MEDIA_TRANSPORT_INTERFACE):
+            logger.info("→ [DEBUG] A2DP transport already up on %s", device_path)
+            return
+
+        logger.info("→ [DEBUG] Asking BlueZ to connect A2DP on %s", device_path)
+        try:
+            self._iface(device_path, DEVICE_INTERFACE).ConnectProfile(A2DP_UUID)
+            logger.info("→ [DEBUG] ConnectProfile(A2DP) succeeded")
+        except Exception as e:
+            logger.info("⚠️ ConnectProfile(A2DP) failed: %s", e)
 
     def _disconnect_everywhere(self, mac: str):
-        obj_mgr = self.bus.get("org.bluez", "/").GetManagedObjects()
-        for path, ifaces in obj_mgr.items():
-            dev = ifaces.get("org.bluez.Device1")
-            if dev and dev.get("Address", "").upper() == mac and dev.get("Connected", False):
-                disconnect_device_dbus(path, mac, self.bus)
+        # the cache indexes devices by address – one path per adapter
+        paths = [
+            path for path in self.objects.device_paths(mac)
+            if self.objects.get(path).get(DEVICE_INTERFACE, {}).get("Connected", False)
+        ]
+        self._disconnect_many([(path, mac) for path in paths])
+        # nothing was connected, but a loopback may still be up
         if mac in self.loopbacks:
-            remove_loopback_for_device(mac)
-            self.loopbacks.remove(mac)
+            self._queue_loopback(mac, create=False)
+
+    def _disconnect_many(self, targets: List[Tuple[str, str]]):
+        """Disconnect every (device path, mac) in *targets*.
+
+        Each target sits on its own adapter, and adapters are independent
+        hardware, so the Disconnect RPCs overlap instead of queueing.  The
+        pool threads only talk D-Bus; loopback removal is queued to the
+        PulseAudio worker afterwards, once per MAC.
+        """
+        if len(targets) == 1:
+            done = [disconnect_device_dbus(targets[0][0], self.bus)]
+        elif targets:
+            with ThreadPoolExecutor(max_workers=min(8, len(targets))) as ex:
+                done = list(ex.map(lambda t: disconnect_device_dbus(t[0], self.bus), targets))
+        else:
+            return
+        for mac in dict.fromkeys(mac for (_, mac), ok in zip(targets, done) if ok):
+            self._queue_loopback(mac, create=False)
 
-    def _analyze_device(self, adapter_mac: str, dev_mac: str) -> str:
-        objects = self.bus.get("org.bluez", "/").GetManagedObjects()
+    def _analyze_device(self, adapter_mac: str, dev_mac: str, objects: Dict | None = None) -> str:
+        if objects is None:
+            objects = self.objects.snapshot()
 
         # Locate the Device1 dictionary for this mac *on the chosen adapter*
         dev_path = self._device_path(adapter_mac, dev_mac)
@@ -401,7 +570,7 @@ class ConnectionService:
         connected  = dev.get("Connected",False)
         uuids      = dev.get("UUIDs",    [])
 
-        has_audio  = any("110b" in u.lower() for u in uuids)  # A2DP/AVRCP
+        has_audio  = not _AUDIO_UUIDS.isdisjoint(uuids)
 
         if connected and has_audio:
             return "already_connected"
@@ -422,12 +591,12 @@ class ConnectionService:
         ctrl_mac – adapter’s Bluetooth MAC address (e.g. BC:FC:E7:21:21:C6)
         dev_mac  – speaker MAC (e.g. 00:0C:8A:FF:18:FE)
         """
-        objects = self.bus.get("org.bluez", "/").GetManagedObjects()
-
-        dev_mac_fmt = dev_mac.upper().replace(":", "_")
-        for path, ifaces in objects.items():
-            if "org.bluez.Adapter1" in ifaces:
-                addr = ifaces["org.bluez.Adapter1"].get("Address", "").upper()
-                if addr == ctrl_mac.upper():
-                    return f"{path}/dev_{dev_mac_fmt}"
-        return None
+        key = (ctrl_mac.upper(), dev_mac.upper())
+        path = self._path_for.get(key)
+        if path is not None:
+            return path
+        adapter_path = self.objects.adapter_path(key[0])
+        if adapter_path is None:
+            return None
+        path = self._path_for[key] = f"{adapter_path}/dev_{key[1].translate(_MAC_TRANS)}"
+        return path
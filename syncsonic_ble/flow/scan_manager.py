@@ -6,8 +6,8 @@ Thread‑safe owner of *all* Bluetooth discovery activity.
 *   **Exactly one** `StartDiscovery` / `StopDiscovery` call sequence per adapter.
 *   Reference count per adapter so multiple callers can share the same scan.
 *   Blocking `wait_for_device()` helper that any thread can call.
-*   No sleeps: uses `threading.Condition` to wait for BlueZ `InterfacesAdded`
-    signals.
+*   No sleeps: a `threading.Event` per awaited device path is set straight
+    from the BlueZ `InterfacesAdded` signal.
 
 The class is transport‑agnostic: Flask, BLE, CLI – anyone can call
 `ensure_discovery()` + `wait_for_device()` from any thread.  All BlueZ work is
@@ -18,12 +18,12 @@ re‑entrant locks so parallel callers behave correctly.
 from __future__ import annotations
 
 import threading
-import time
 from typing import Dict, Optional
 from ..logging_conf import get_logger
 from typing import Any
 
 from syncsonic_ble.infra.bus_manager import get_bus
+from syncsonic_ble.infra.bluez_cache import get_object_cache
 
 logger = get_logger(__name__)
 
@@ -32,10 +32,11 @@ logger = get_logger(__name__)
 # ---------------------------------------------------------------------------
 
 class _AdapterEntry:
-    __slots__ = ("proxy", "refcount")
+    __slots__ = ("proxy", "path", "refcount")
 
-    def __init__(self, proxy: Any):
+    def __init__(self, proxy: Any, path: str):
         self.proxy: Any = proxy
+        self.path: str = path
         self.refcount: int = 0
 
 # ---------------------------------------------------------------------------
@@ -61,14 +62,19 @@ class ScanManager:
         self._bus = get_bus()
         self._adapters: Dict[str, _AdapterEntry] = {}   # mac → entry
         self._lock = threading.RLock()                  # guards adapters & maps
-        self._cond = threading.Condition(self._lock)    # signalled on device add
+        self._device_events: Dict[str, threading.Event] = {}  # awaited path → event
 
-        # Subscribe once to BlueZ InterfacesAdded signals.
+        # Subscribe once to BlueZ InterfacesAdded/Removed signals.
         self._bus.subscribe(
             iface="org.freedesktop.DBus.ObjectManager",
             signal="InterfacesAdded",
             signal_fired=self._on_interfaces_added,
         )
+        self._bus.subscribe(
+            iface="org.freedesktop.DBus.ObjectManager",
+            signal="InterfacesRemoved",
+            signal_fired=self._on_interfaces_removed,
+        )
 
         # Build initial adapter map.
         self._refresh_adapters()
@@ -123,31 +129,47 @@ class ScanManager:
         """
         adapter_mac = adapter_mac.upper()
         target_mac = target_mac.upper()
-        deadline = time.time() + timeout_s
 
-        with self._cond:
+        with self._lock:
+            entry = self._adapters.get(adapter_mac)
+            if not entry:
+                return None
+            path = f"{entry.path}/dev_{target_mac.replace(':', '_')}"
+            # register before the fast-path check so a signal arriving in
+            # between cannot be missed
+            event = self._device_events.setdefault(path, threading.Event())
+
+        try:
             # Fast‑path: maybe it is already in the object tree
-            path = self._lookup_device_path(adapter_mac, target_mac)
-            if path:
+            if self._device_exists(path):
                 return path
-
             # Wait until InterfacesAdded arrives or timeout.
-            while time.time() < deadline:
-                remaining = deadline - time.time()
-                self._cond.wait(timeout=remaining)
-                path = self._lookup_device_path(adapter_mac, target_mac)
-                if path:
-                    return path
-        return None
+            return path if event.wait(timeout_s) else None
+        finally:
+            with self._lock:
+                self._device_events.pop(path, None)
 
     # -----------------------------
     # BlueZ signal handler
     # -----------------------------
 
-    def _on_interfaces_added(self, sender, object_path, *args, **kwargs):  # noqa: D401,E501  # pragma: no cover
-        # We don’t care about the details; just wake up waiters.
-        with self._cond:
-            self._cond.notify_all()
+    def _on_interfaces_added(self, sender, object_path, iface, signal, params):  # pragma: no cover
+        path, ifaces = params
+        if "org.bluez.Device1" not in ifaces:
+            return
+        with self._lock:
+            event = self._device_events.get(path)
+        if event:
+            event.set()
+
+    def _on_interfaces_removed(self, sender, object_path, iface, signal, params):  # pragma: no cover
+        path, ifaces = params
+        if "org.bluez.Device1" not in ifaces:
+            return
+        with self._lock:
+            event = self._device_events.get(path)
+        if event:
+            event.clear()
 
     # -----------------------------
     # Internal helpers
@@ -155,25 +177,14 @@ class ScanManager:
 
     def _refresh_adapters(self):
         """Populate the adapters dict from current BlueZ object tree."""
-        om = self._bus.get("org.bluez", "/")
-        objects = om.GetManagedObjects()
-        for path, ifaces in objects.items():
-            if "org.bluez.Adapter1" in ifaces:
-                mac = ifaces["org.bluez.Adapter1"].get("Address", "").upper()
-                if mac not in self._adapters:
-                    proxy = self._bus.get("org.bluez", path)
-                    self._adapters[mac] = _AdapterEntry(proxy)
-
-    def _lookup_device_path(self, adapter_mac: str, dev_mac: str) -> Optional[str]:
-        """Return device object path if it exists under *adapter_mac*."""
-        om = self._bus.get("org.bluez", "/")
-        objects = om.GetManagedObjects()
-        dev_mac_fmt = dev_mac.replace(":", "_")
-        for path, ifaces in objects.items():
-            if "org.bluez.Device1" in ifaces and path.endswith(dev_mac_fmt):
-                if path.startswith(self._adapters[adapter_mac].proxy._path):  # type: ignore[attr-defined]  # noqa: SLF001
-                    return path
-        return None
+        for mac, path in get_object_cache().adapters().items():
+            if mac not in self._adapters:
+                proxy = self._bus.get("org.bluez", path)
+                self._adapters[mac] = _AdapterEntry(proxy, path)
+
+    def _device_exists(self, path: str) -> bool:
+        """Return True if BlueZ already exports a Device1 at *path*."""
+        return "org.bluez.Device1" in get_object_cache().get(path)
 
     def refresh_adapters(self) -> None:
         """
@@ -0,0 +1,317 @@
+# bluez_cache.py
+"""bluez_cache
+===============
+Process‑wide **mirror of BlueZ's object tree**.
+
+*   Calls ``GetManagedObjects`` exactly once, then keeps the copy current from
+    ``InterfacesAdded`` / ``InterfacesRemoved`` / ``PropertiesChanged``.
+*   Secondary indexes (adapter MAC → path, device MAC → paths, adapter path →
+    its devices) are updated by
+    the same handlers, so the usual lookups are dict fetches, not tree scans.
+*   Entries are replaced, never mutated: a snapshot handed out earlier stays
+    stable while the caller iterates it.
+
+Usage
+-----
+```python
+from syncsonic_ble.infra.bluez_cache import get_object_cache
+cache = get_object_cache()           # safe in any thread
+objects = cache.snapshot()           # same shape as GetManagedObjects()
+```
+Signals are delivered by the GLib main loop that pydbus is attached to, so
+one must be running (gatt_server's, or :func:`event_pump.start_event_pump`).
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from gi.repository import Gio, GLib
+
+from syncsonic_ble.infra.bus_manager import get_bus
+from ..constants import (BLUEZ_SERVICE_NAME, DBUS_OM_IFACE, DBUS_PROP_IFACE,
+                         ADAPTER_INTERFACE, DEVICE_INTERFACE, MEDIA_TRANSPORT_INTERFACE)
+
+Objects = Dict[str, Dict[str, Dict]]
+
+# The only interfaces anything here reads.  BlueZ also exports GATT
+# services/characteristics, MediaControl1, Battery1, … for every device;
+# those are never unpacked or stored.
+_KEEP = frozenset((ADAPTER_INTERFACE, DEVICE_INTERFACE, MEDIA_TRANSPORT_INTERFACE))
+
+_GMO_REPLY = GLib.VariantType.new("(a{oa{sa{sv}}})")
+
+
+class BluezObjectCache:
+    """Local copy of ``org.bluez``'s managed objects, kept in sync by signals."""
+
+    def __init__(self, bus=None):
+        self._bus = bus or get_bus()
+        self._lock = threading.RLock()
+        # wait_for_property() callers, keyed so a delta wakes only its own
+        self._waiters: Dict[Tuple[str, str], List[threading.Event]] = {}
+        self._objects: Objects = {}
+        self._adapter_by_mac: Dict[str, str] = {}          # "AA:BB:…" → /org/bluez/hciX
+        self._by_address: Dict[str, Tuple[str, ...]] = {}  # device MAC → its paths
+        self._by_adapter: Dict[str, Dict[str, str]] = {}   # adapter path → {MAC: path}
+
+        # extra handlers run after the cache is updated (GLib thread)
+        self._props_listeners: List[Callable[[str, str, Dict], None]] = []
+        self._removed_listeners: List[Callable[[str, List[str]], None]] = []
+        self._added_listeners: List[Callable[[str, Dict[str, Dict]], None]] = []
+
+        # Subscribe first, then seed, so nothing published in between is lost.
+        self._bus.subscribe(
+            sender=BLUEZ_SERVICE_NAME,
+            iface=DBUS_OM_IFACE,
+            signal="InterfacesAdded",
+            signal_fired=self._on_ifaces_added,
+        )
+        self._bus.subscribe(
+            sender=BLUEZ_SERVICE_NAME,
+            iface=DBUS_OM_IFACE,
+            signal="InterfacesRemoved",
+            signal_fired=self._on_ifaces_removed,
+        )
+        # PropertiesChanged is by far the busiest BlueZ signal (RSSI during
+        # scans, transport volume/state while playing).  One match rule per
+        # mirrored interface with an arg0 filter, so dbus-daemon drops
+        # MediaTransport1/MediaPlayer1/… updates before they reach us.
+        self._props_subs = [
+            self._bus.con.signal_subscribe(
+                BLUEZ_SERVICE_NAME, DBUS_PROP_IFACE, "PropertiesChanged",
+                None, iface, Gio.DBusSignalFlags.NONE, self._on_props_changed,
+            )
+            for iface in (DEVICE_INTERFACE, ADAPTER_INTERFACE)
+        ]
+
+        seed = self._fetch_managed_objects()
+        with self._lock:
+            for path, seeded in seed.items():
+                # anything a signal already delivered is newer than the seed
+                self._objects[path] = {**seeded, **self._objects.get(path, {})}
+                self._index(path, seeded)
+
+    def _fetch_managed_objects(self) -> Objects:
+        """GetManagedObjects, unpacking only the interfaces in ``_KEEP``."""
+        reply = self._bus.con.call_sync(
+            BLUEZ_SERVICE_NAME, "/", DBUS_OM_IFACE, "GetManagedObjects", None,
+            _GMO_REPLY, Gio.DBusCallFlags.NONE, -1, None,
+        )
+        tree = reply.get_child_value(0)
+        objects: Objects = {}
+        for i in range(tree.n_children()):
+            entry = tree.get_child_value(i)
+            ifaces = entry.get_child_value(1)
+            kept = {}
+            for j in range(ifaces.n_children()):
+                iface = ifaces.get_child_value(j)
+                name = iface.get_child_value(0).get_string()
+                if name in _KEEP:
+                    kept[name] = iface.get_child_value(1).unpack()
+            if kept:
+                objects[entry.get_child_value(0).get_string()] = kept
+        return objects
+
+    # -----------------------------
+    # Read API
+    # -----------------------------
+
+    def snapshot(self) -> Objects:
+        """Shallow copy of the tree (GetManagedObjects shape)."""
+        with self._lock:
+            return dict(self._objects)
+
+    def get(self, path: str) -> Dict[str, Dict]:
+        """Interfaces → properties for *path*; empty dict if unknown."""
+        return self._objects.get(path, {})
+
+    def adapter_path(self, adapter_mac: str) -> Optional[str]:
+        return self._adapter_by_mac.get(adapter_mac.upper())
+
+    def adapters(self) -> Dict[str, str]:
+        """Copy of adapter MAC → adapter path."""
+        return dict(self._adapter_by_mac)
+
+    def device_paths(self, mac: str) -> Tuple[str, ...]:
+        """Every object path (one per adapter) BlueZ has for device *mac*."""
+        return self._by_address.get(mac.upper(), ())
+
+    def devices(self) -> List[Dict]:
+        """Device1 properties of every device object, across all adapters."""
+        with self._lock:
+            return [self._objects[p][DEVICE_INTERFACE]
+                    for paths in self._by_address.values() for p in paths]
+
+    def device_path_on(self, adapter_path: str, mac: str) -> Optional[str]:
+        """Path of device *mac* under *adapter_path*, if BlueZ exports one."""
+        return self._by_adapter.get(adapter_path, {}).get(mac.upper())
+
+    def devices_on(self, adapter_path: str) -> Dict[str, str]:
+        """Copy of MAC → device path for every device under *adapter_path*."""
+        return dict(self._by_adapter.get(adapter_path, {}))
+
+    def has_iface_below(self, path: str, iface: str) -> bool:
+        """True if some child object of *path* exports *iface*."""
+        prefix = path + "/"
+        with self._lock:
+            return any(p.startswith(prefix) and iface in i
+                       for p, i in self._objects.items())
+
+    def wait_for_property(self, path: str, iface: str, prop: str, value,
+                          timeout: float) -> bool:
+        """Block until *prop* on *path* equals *value*; False on timeout.
+
+        Returns immediately if the cached value already matches.  Only
+        Device1 and Adapter1 properties are tracked.
+        """
+        key = (path, prop)
+        event = threading.Event()
+        deadline = time.monotonic() + timeout
+        with self._lock:
+            self._waiters.setdefault(key, []).append(event)
+        try:
+            while True:
+                if self._objects.get(path, {}).get(iface, {}).get(prop) == value:
+                    return True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not event.wait(remaining):
+                    return False
+                event.clear()
+        finally:
+            with self._lock:
+                waiters = self._waiters[key]
+                waiters.remove(event)
+                if not waiters:
+                    del self._waiters[key]
+
+    # -----------------------------
+    # Listener registration
+    # -----------------------------
+
+    def on_props_changed(self, cb: Callable[[str, str, Dict], None]) -> None:
+        """cb(path, iface, changed) after a Device1/Adapter1 change is applied."""
+        self._props_listeners.append(cb)
+
+    def on_added(self, cb: Callable[[str, Dict[str, Dict]], None]) -> None:
+        """cb(path, ifaces) after newly exported interfaces are cached."""
+        self._added_listeners.append(cb)
+
+    def on_removed(self, cb: Callable[[str, List[str]], None]) -> None:
+        """cb(path, ifaces) after interfaces are removed from the cache."""
+        self._removed_listeners.append(cb)
+
+    # -----------------------------
+    # Index maintenance (lock held)
+    # -----------------------------
+
+    def _index(self, path: str, ifaces: Dict[str, Dict]):
+        adapter = ifaces.get(ADAPTER_INTERFACE)
+        if adapter and "Address" in adapter:
+            self._adapter_by_mac[sys.intern(str(adapter["Address"]).upper())] = path
+        dev = ifaces.get(DEVICE_INTERFACE)
+        if dev and "Address" in dev:
+            # interned: the same MAC keys every index and is looked up a lot
+            mac = sys.intern(str(dev["Address"]).upper())
+            paths = self._by_address.get(mac, ())
+            if path not in paths:
+                self._by_address[mac] = paths + (path,)
+            owner = _owning_adapter(path, dev)
+            self._by_adapter[owner] = {**self._by_adapter.get(owner, {}), mac: path}
+
+    def _unindex(self, path: str, ifaces: List[str]):
+        if ADAPTER_INTERFACE in ifaces:
+            self._adapter_by_mac = {m: p for m, p in self._adapter_by_mac.items()
+                                    if p != path}
+            self._by_adapter.pop(path, None)
+        if DEVICE_INTERFACE in ifaces:
+            dev = self._objects.get(path, {}).get(DEVICE_INTERFACE, {})
+            mac = str(dev.get("Address", "")).upper()
+            owner = _owning_adapter(path, dev)
+            devices = {m: p for m, p in self._by_adapter.get(owner, {}).items()
+                       if p != path}
+            if devices:
+                self._by_adapter[owner] = devices
+            else:
+                self._by_adapter.pop(owner, None)
+            paths = tuple(p for p in self._by_address.get(mac, ()) if p != path)
+            if paths:
+                self._by_address[mac] = paths
+            else:
+                self._by_address.pop(mac, None)
+
+    # -----------------------------
+    # BlueZ signal handlers
+    # -----------------------------
+
+    def _on_ifaces_added(self, sender, obj_path, iface, signal, params):
+        path, ifaces = params
+        added = {name: dict(props) for name, props in ifaces.items() if name in _KEEP}
+        if not added:
+            return
+        with self._lock:
+            self._objects[path] = {**self._objects.get(path, {}), **added}
+            self._index(path, added)
+        for cb in self._added_listeners:
+            cb(path, added)
+
+    def _on_ifaces_removed(self, sender, obj_path, iface, signal, params):
+        path, ifaces = params
+        with self._lock:
+            self._unindex(path, ifaces)
+            entry = self._objects.get(path)
+            if entry is not None:
+                entry = {k: v for k, v in entry.items() if k not in ifaces}
+                if entry:
+                    self._objects[path] = entry
+                else:
+                    del self._objects[path]
+        for cb in self._removed_listeners:
+            cb(path, ifaces)
+
+    def _on_props_changed(self, _con, sender, obj_path, iface, signal, params):
+        # arg0 matching already limited this to Device1/Adapter1
+        changed_iface, changed_dict, invalidated = params.unpack()
+
+        with self._lock:
+            props = self._objects.get(obj_path, {}).get(changed_iface)
+            if props is not None:
+                props = {**props, **changed_dict}
+                for name in invalidated:
+                    props.pop(name, None)
+                self._objects[obj_path] = {**self._objects[obj_path],
+                                           changed_iface: props}
+            if self._waiters:
+                for name in changed_dict:
+                    for event in self._waiters.get((obj_path, name), ()):
+                        event.set()
+        for cb in self._props_listeners:
+            cb(obj_path, changed_iface, changed_dict)
+
+
+def _owning_adapter(path: str, dev: Dict) -> str:
+    """Adapter path for a Device1 – its ``Adapter`` property, else the parent path."""
+    return str(dev.get("Adapter") or path.rsplit("/", 1)[0])
+
+
+# ---------------------------------------------------------------------------
+# Singleton accessor (lock-guarded global, as bus_manager does for _BUS)
+# ---------------------------------------------------------------------------
+
+_LOCK = threading.Lock()
+_CACHE: Optional[BluezObjectCache] = None
+
+
+def get_object_cache() -> BluezObjectCache:
+    """Return the process‑wide :class:`BluezObjectCache` (built on first use)."""
+    global _CACHE
+
+    if _CACHE is not None:          # fast path once built, no lock
+        return _CACHE
+    with _LOCK:
+        if _CACHE is None:
+            _CACHE = BluezObjectCache()
+    return _CACHE
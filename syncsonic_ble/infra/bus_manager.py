@@ -21,6 +21,7 @@ socket automatically, so you don’t need an explicit shutdown.
 
 from __future__ import annotations
 
+import functools
 import threading
 from typing import Optional
 
@@ -38,19 +39,19 @@ _BUS: Optional[SystemBus] = None  # the singleton instance
 # Public API
 # ---------------------------------------------------------------------------
 
+@functools.cache
 def get_bus() -> SystemBus:
     """Return the process‑wide :class:`pydbus.SystemBus`.
 
     Calling this function from multiple threads is safe; the first caller wins
     the creation race, everyone else immediately reuses the same connection.
+    After the first call the C‑level cache answers without running this body.
     """
     global _BUS
 
-    if _BUS is None:
-        # Fast path failed – only then pay the cost of locking.
-        with _LOCK:
-            # Double‑checked locking pattern: another thread may have created
-            # the bus while we were waiting for the lock.
-            if _BUS is None:
-                _BUS = SystemBus()
+    # functools.cache does not stop two first‑time callers from both entering
+    # here, so creation itself stays under the lock.
+    with _LOCK:
+        if _BUS is None:
+            _BUS = SystemBus()
     return _BUS
@@ -1,18 +1,31 @@
 # event_pump.py
+import os
 import threading
 from gi.repository import GLib
 from syncsonic_ble.infra.bus_manager import get_bus
 
 
+def _pin_to_one_cpu():
+    """Best effort: keep signal dispatch on one core, away from the workers."""
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        cpus = sorted(os.sched_getaffinity(0))
+        if len(cpus) > 1:
+            os.sched_setaffinity(0, {cpus[0]})   # 0 → the calling thread
+    except OSError:
+        pass
+
+
 def start_event_pump():
     """Start GLib MainLoop in a background thread exactly once."""
     def _runner():
-       
+        _pin_to_one_cpu()
         loop = GLib.MainLoop()
         loop.run()
 
     # Singleton pattern so multiple imports don't spawn extra threads.
     if not getattr(start_event_pump, "_started", False):
         bus = get_bus()  # Touching the bus forces pydbus to initialise GLib
-        threading.Thread(target=_runner, daemon=True).start()
+        threading.Thread(target=_runner, name="glib-pump", daemon=True).start()
         start_event_pump._started = True
@@ -1,12 +1,34 @@
 """Central logging setup so *every* module shares the same formatter."""
-import logging, sys
+import logging, os, sys, time
 
 LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Per-notification / per-object debug lines are only worth their formatting
+# cost while troubleshooting; opt in with SYNCSONIC_DEBUG=1.
+LOG_LEVEL = logging.DEBUG if os.environ.get("SYNCSONIC_DEBUG") == "1" else logging.INFO
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Same output as the stock formatter, but strftime runs once per second."""
+    _cached = (None, "")            # (epoch second, formatted second)
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, text = self._cached
+        if sec != cached_sec:
+            text = time.strftime(self.default_time_format, self.converter(sec))
+            self._cached = (sec, text)    # one tuple swap, safe across threads
+        return self.default_msec_format % (text, record.msecs)
+
+
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(_CachedTimeFormatter(LOG_FORMAT))
 logging.basicConfig(
-    level=logging.DEBUG,
-    format=LOG_FORMAT,
-    handlers=[logging.StreamHandler(sys.stdout)],
+    level=LOG_LEVEL,
+    handlers=[_handler],
 )
 
 def get_logger(name: str) -> logging.Logger:      # convenience helper
-    return logging.getLogger(name)
\ No newline at end of file
+    return logging.getLogger(name)
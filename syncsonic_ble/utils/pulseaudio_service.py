@@ -1,141 +1,420 @@
 # utils/pulseaudio.py
+import collections
+import os
+import selectors
 import subprocess
+import threading
 import time
 from typing import List, Optional
 
-HEADER = '\033[95m'
-BLUE = '\033[94m'
-GREEN = '\033[92m'
-YELLOW = '\033[93m'
-RED = '\033[91m'
-ENDC = '\033[0m'
-BOLD = '\033[1m'
-UNDERLINE = '\033[4m'
+from ..logging_conf import get_logger
 
-# utils/pulseaudio.py (add this function)
-import subprocess
+log = get_logger(__name__)
+
+# A wedged PulseAudio (or pipewire-pulse bridge) makes pactl block forever;
+# bound every call so the caller's worker thread can't hang with it.
+# load-module waits on the server instantiating the module, so it gets more.
+_PACTL_TIMEOUT_S = 3.0
+_PACTL_LOAD_TIMEOUT_S = 10.0
+
+# Longest _wait_for_sink sleeps on the subscription before re-listing sinks.
+_SINK_RECHECK_S = 1.0
+
+# In-process counters: pactl forks (subscribers included) and their wall
+# time, list-cache hits and misses, time spent waiting for speaker sinks.
+# Bumped from the GLib, BlueZ-worker, pool and PA-worker threads, so every
+# update takes _METRICS_LOCK.
+_METRICS: collections.Counter = collections.Counter()
+_METRICS_LOCK = threading.Lock()
+
+
+def get_pulseaudio_metrics() -> dict:
+    """Copy of the pactl / loopback counters (times in milliseconds)."""
+    with _METRICS_LOCK:
+        return dict(_METRICS)
+
+
+def _bump(key: str, amount: float = 1):
+    with _METRICS_LOCK:
+        _METRICS[key] += amount
+
+
+def _record_pactl(t0: float, calls: int = 1):
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    with _METRICS_LOCK:
+        _METRICS["pactl_calls"] += calls
+        _METRICS["pactl_time_ms"] += elapsed_ms
+
+
+def pactl_output(*args: str, timeout: float = _PACTL_TIMEOUT_S) -> subprocess.CompletedProcess:
+    """Run pactl and capture its output (decoded once, as text).
+
+    stdin is /dev/null and close_fds=False: pactl is short-lived and we hold
+    no descriptors it must not see, so skip the close-every-fd walk per fork.
+    A timeout is reported as a failed run (returncode 124, like timeout(1)).
+    """
+    t0 = time.perf_counter()
+    try:
+        return subprocess.run(
+            ("pactl", *args),
+            stdin=subprocess.DEVNULL, capture_output=True, text=True,
+            check=False, close_fds=False, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        _bump("pactl_timeouts")
+        return subprocess.CompletedProcess(("pactl", *args), 124, "", "timed out")
+    finally:
+        _record_pactl(t0)
+
+
+def pactl(*args: str, timeout: float = _PACTL_TIMEOUT_S) -> bool:
+    """Run a pactl command whose output we don't need; True on success.
+
+    No pipes and close_fds=False keep subprocess on the posix_spawn fast path.
+    """
+    t0 = time.perf_counter()
+    try:
+        return subprocess.run(
+            ("pactl", *args),
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, check=False, close_fds=False,
+            timeout=timeout,
+        ).returncode == 0
+    except subprocess.TimeoutExpired:
+        _bump("pactl_timeouts")
+        return False
+    finally:
+        _record_pactl(t0)
+
+
+_MAC_TR = str.maketrans({":": "_"})
+_sink_cache: dict[str, str] = {}
+
+
+def sink_name_for(mac: str) -> str:
+    """A2DP sink name PulseAudio gives the speaker *mac* (built once per MAC)."""
+    name = _sink_cache.get(mac)
+    if name is None:
+        name = _sink_cache[mac] = f"bluez_sink.{mac.translate(_MAC_TR)}.a2dp_sink"
+    return name
+
+
+# Loopback module ids we loaded, keyed by the resolved sink name (whatever
+# prefix create_loopback was given), so removal is a single unload-module
+# instead of a lookup.  _unload_modules drops the entries it unloads.
+_loopback_modules: dict[str, str] = {}
+
+# The PA worker and the GLib thread (DeviceManager, SET_LATENCY) both create
+# and remove loopbacks.  Each list → unload → load → record sequence runs
+# under this lock, so two of them can't interleave and leave a loaded module
+# nobody recorded.  Re-entrant: _unload_modules re-takes it to forget ids.
+_LOOPBACK_LOCK = threading.RLock()
+
+# Parsed `pactl list short <kind>` output, shared for a short window so a
+# burst of lookups during loopback setup costs one fork instead of several.
+_LIST_TTL_S = 0.25
+_pactl_cache: dict[str, tuple[float, List[List[str]]]] = {}
+
+
+def _list_short(kind: str, ttl: float = _LIST_TTL_S) -> List[List[str]]:
+    """Rows of `pactl list short <kind>` split on tabs, cached for *ttl* s."""
+    now = time.monotonic()
+    cached = _pactl_cache.get(kind)
+    if cached and now - cached[0] < ttl:
+        _bump("pactl_cache_hits")
+        return cached[1]
+    _bump("pactl_cache_misses")
+    out = pactl_output("list", "short", kind).stdout
+    rows = [line.split("\t") for line in out.splitlines() if line]
+    _pactl_cache[kind] = (now, rows)
+    return rows
 
 
+def _invalidate_list(kind: str):
+    _pactl_cache.pop(kind, None)
+
 
 def remove_loopback_for_device(mac: str):
-    sink_name = f"bluez_sink.{mac.replace(':', '_')}.a2dp_sink"
-    subprocess.call(["pactl", "unload-module", f"module-loopback sink={sink_name}"])
+    sink_name = sink_name_for(mac)
+    with _LOOPBACK_LOCK:
+        module_id = _loopback_modules.pop(sink_name, None)
+        if module_id is not None and pactl("unload-module", module_id):
+            _invalidate_list("modules")
+            return
+
+        # Not one we loaded, a stale id, or we restarted since: unload-module
+        # only takes an index or a bare module name, so look the loopbacks up
+        # by argument.
+        # The sink may carry a suffix after the prefix, as in create_loopback.
+        _unload_modules([
+            parts[0] for parts in _list_short("modules", ttl=0)
+            if (len(parts) >= 3 and parts[1] == "module-loopback"
+                and f"sink={sink_name}" in parts[2])
+        ])
+        _invalidate_list("modules")
+
+
+def _forget_modules(module_ids: List[str]):
+    """Drop recorded loopback ids that are about to be unloaded."""
+    gone = set(module_ids)
+    with _LOOPBACK_LOCK:
+        for sink_name, module_id in list(_loopback_modules.items()):
+            if module_id in gone:
+                del _loopback_modules[sink_name]
+
+
+def _unload_modules(module_ids: List[str]):
+    """unload-module each id; several go out as concurrent pactl processes.
+
+    pactl takes one command per invocation (it has no script mode), so the
+    forks can't be merged – but they needn't run back to back either.
+    """
+    _forget_modules(module_ids)
+    if len(module_ids) <= 1:
+        if module_ids:
+            pactl("unload-module", module_ids[0])
+        return
+    t0 = time.perf_counter()
+    procs = [
+        subprocess.Popen(
+            ("pactl", "unload-module", module_id),
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, close_fds=False,
+        )
+        for module_id in module_ids
+    ]
+    deadline = time.monotonic() + _PACTL_TIMEOUT_S
+    for proc in procs:
+        try:
+            proc.wait(max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            _bump("pactl_timeouts")
+            proc.kill()
+            proc.wait()
+    _record_pactl(t0, len(procs))
 
     
 
 def setup_pulseaudio():
-    import subprocess
-    import time
-
     try:
         # Step 1: Check if PulseAudio is responsive
-        info_result = subprocess.run(["pactl", "info"], capture_output=True, text=True)
+        info_result = pactl_output("info")
         if info_result.returncode != 0 or "Server Name" not in info_result.stdout:
            
 
-            # Kill existing PulseAudio processes
-            subprocess.run(["pkill", "-9", "pulseaudio"], check=False)
-            time.sleep(1)
+            # Kill existing PulseAudio processes.  It isn't answering, so
+            # `pulseaudio -k` (which asks it over its socket) won't do; wait
+            # for the killed process to be gone rather than a blind second.
+            subprocess.run(["pkill", "-9", "pulseaudio"], check=False, timeout=_PACTL_TIMEOUT_S)
+
+            def gone():
+                return subprocess.run(
+                    ["pgrep", "-x", "pulseaudio"], stdout=subprocess.DEVNULL,
+                    check=False, timeout=_PACTL_TIMEOUT_S,
+                ).returncode != 0
+
+            _backoff_until(gone, time.monotonic() + 1)
 
             # Start a new session
-            subprocess.run(["pulseaudio", "--start"], check=False)
+            subprocess.run(["pulseaudio", "--start"], check=False, timeout=_PACTL_LOAD_TIMEOUT_S)
            
 
             # Wait for it to respond
-            for i in range(5):
-                result = subprocess.run(["pactl", "info"], capture_output=True, text=True)
-                if result.returncode == 0 and "Server Name" in result.stdout:
-                  
-                    break
-                time.sleep(1)
-            else:
-       
+            def responsive():
+                result = pactl_output("info")
+                return result.returncode == 0 and "Server Name" in result.stdout
+
+            if not _backoff_until(responsive, time.monotonic() + 5):
                 return False
 
       
 
         # Step 2: Check if virtual_out sink already exists
-        existing = subprocess.run(["pactl", "list", "short", "sinks"], capture_output=True, text=True)
-        if "virtual_out" in existing.stdout:
-        
+        if any(len(row) >= 2 and row[1] == "virtual_out" for row in _list_short("sinks")):
             return True
 
         # Step 3: Load virtual sink
-        result = subprocess.run([
-            "pactl", "load-module", "module-null-sink",
+        result = pactl_output(
+            "load-module", "module-null-sink",
             "sink_name=virtual_out",
-            "sink_properties=device.description=virtual_out"
-        ], capture_output=True, text=True)
+            "sink_properties=device.description=virtual_out",
+            timeout=_PACTL_LOAD_TIMEOUT_S,
+        )
 
+        _invalidate_list("sinks")
+        _invalidate_list("modules")
         if result.returncode != 0:
           
             return False
 
 
         # Step 4: Set it as the default sink
-        set_result = subprocess.run(["pactl", "set-default-sink", "virtual_out"], capture_output=True, text=True)
-        if set_result.returncode != 0:
+        if not pactl("set-default-sink", "virtual_out"):
         
             return False
 
         return True
 
-    except Exception as e:
-   
+    except Exception:
+        # traceback is formatted only if the record is actually emitted
+        log.exception("PulseAudio setup failed")
         return False
 
 
 
 
+def _wait_for_sink(find_sink, wait_seconds: float) -> Optional[str]:
+    """
+    Return find_sink()'s result once the sink exists, or None after wait_seconds.
+    Instead of re-listing sinks on a timer, sleep on `pactl subscribe` and only
+    look again when PulseAudio reports a new sink.  Falls back to polling if
+    the subscription cannot be started or dies.
+    """
+    deadline = time.monotonic() + wait_seconds
+    # the common case – the sink is already there – needs no subscriber,
+    # and neither does a caller whose time is already up
+    name = find_sink()
+    if name or wait_seconds <= 0:
+        return name
+
+    try:
+        # subscribe *before* re-listing so a sink appearing in between
+        # still produces an event we will see
+        sub = subprocess.Popen(["pactl", "subscribe"], stdin=subprocess.DEVNULL,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                               bufsize=0)
+    except OSError:
+        sub = None
+    else:
+        # long-lived, so counted as a call but kept out of pactl_time_ms
+        with _METRICS_LOCK:
+            _METRICS["pactl_calls"] += 1
+            _METRICS["pactl_subscribes"] += 1
+
+    try:
+        # a cached listing may predate the subscription and hide a sink that
+        # already exists (no 'new' event will ever announce it) – re-list
+        _invalidate_list("sinks")
+        name = find_sink()
+        if name or sub is None:
+            return name or _poll_for_sink(find_sink, deadline)
+
+        fd = sub.stdout.fileno()
+        with selectors.DefaultSelector() as sel:
+            sel.register(fd, selectors.EVENT_READ)
+            pending = b""
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                # a running subscriber isn't necessarily connected yet, so a
+                # sink can slip in unannounced: re-list on every quiet second
+                if not sel.select(min(remaining, _SINK_RECHECK_S)):
+                    _invalidate_list("sinks")
+                    name = find_sink()
+                    if name:
+                        return name
+                    continue
+                chunk = os.read(fd, 4096)
+                if not chunk:                      # subscription went away
+                    return _poll_for_sink(find_sink, deadline)
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                if any(b"'new' on sink" in line for line in lines):
+                    _invalidate_list("sinks")
+                    name = find_sink()
+                    if name:
+                        return name
+    finally:
+        if sub is not None:
+            sub.kill()
+            sub.wait()
+            sub.stdout.close()
+
+
+def _poll_for_sink(find_sink, deadline: float) -> Optional[str]:
+    return _backoff_until(find_sink, deadline)
+
+
+def _backoff_until(check, deadline: float, first: float = 0.01, cap: float = 0.25):
+    """
+    Call check() until it returns something truthy or deadline passes.
+    Sleeps start at 10 ms and grow ×1.6 up to 250 ms, so a quick resource is
+    seen almost at once while a slow one is not hammered.
+    """
+    delay = first
+    while True:
+        result = check()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.6, cap)
+
+
 def create_loopback(expected_sink_prefix: str, latency_ms: int = 100, wait_seconds: int = 20) -> bool:
     """
     Waits for a specific sink to appear (matching by prefix), unloads any existing loopbacks for it,
     and then creates a clean new loopback.
     """
-    def find_actual_sink_name() -> str:
-        result = subprocess.run(["pactl", "list", "sinks", "short"],
-                                capture_output=True, text=True)
-        for line in result.stdout.strip().splitlines():
-            parts = line.split()
-            if len(parts) >= 2 and parts[1].startswith(expected_sink_prefix):
+    return create_loopbacks([expected_sink_prefix], latency_ms, wait_seconds)[expected_sink_prefix]
+
+
+def create_loopbacks(prefixes: List[str], latency_ms: int = 100,
+                     wait_seconds: int = 20) -> dict[str, bool]:
+    """
+    create_loopback for several speakers at once: every sink is waited for
+    within one shared deadline, conflicting loopbacks are found with a single
+    module listing, and the load-module calls are issued back to back.
+    Returns {prefix: created?}.
+    """
+    prefixes = list(dict.fromkeys(prefixes))
+    deadline = time.monotonic() + wait_seconds
+
+    def find_actual_sink_name(prefix: str) -> Optional[str]:
+        for parts in _list_short("sinks"):
+            if len(parts) >= 2 and parts[1].startswith(prefix):
                 return parts[1]
         return None
 
-    def unload_conflicting_loopbacks(actual_sink_name: str):
-        modules_output = subprocess.run(["pactl", "list", "short", "modules"],
-                                        capture_output=True, text=True)
-        for line in modules_output.stdout.strip().splitlines():
-            parts = line.split()
-            if len(parts) >= 2 and "module-loopback" in parts[1] and actual_sink_name in line:
-                module_id = parts[0]
-
-                subprocess.run(["pactl", "unload-module", module_id])
-
-    def load_loopback(actual_sink_name: str):
-        result = subprocess.run([
-            "pactl", "load-module", "module-loopback",
-            "source=virtual_out.monitor",
-            f"sink={actual_sink_name}",
-            f"latency_msec={latency_ms}"
-        ], capture_output=True, text=True)
-        return result
-
-    for _ in range(wait_seconds * 2):
-        actual_sink_name = find_actual_sink_name()
-        if actual_sink_name:
-   
-            unload_conflicting_loopbacks(actual_sink_name)
-            result = load_loopback(actual_sink_name)
+    resolved: dict[str, str] = {}
+    t0 = time.perf_counter()
+    for prefix in prefixes:
+        name = _wait_for_sink(lambda p=prefix: find_actual_sink_name(p),
+                              max(0.0, deadline - time.monotonic()))
+        if name:
+            resolved[prefix] = name
+    _bump("loopback_waits_ms", (time.perf_counter() - t0) * 1000)
+
+    results = dict.fromkeys(prefixes, False)
+    if not resolved:
+        return results
+
+    with _LOOPBACK_LOCK:
+        # unload stale loopbacks into any of these sinks in one pass
+        targets = tuple(resolved.values())
+        _unload_modules([
+            parts[0] for parts in _list_short("modules")
+            if (len(parts) >= 3 and parts[1] == "module-loopback"
+                and any(name in parts[2] for name in targets))
+        ])
+
+        for prefix, actual_sink_name in resolved.items():
+            result = pactl_output(
+                "load-module", "module-loopback",
+                "source=virtual_out.monitor",
+                f"sink={actual_sink_name}",
+                f"latency_msec={latency_ms}",
+                timeout=_PACTL_LOAD_TIMEOUT_S,
+            )
             if result.returncode == 0:
-      
-                return True
-            else:
-      
-                return False
-        time.sleep(0.5)
-
-
-    return False
+                # load-module prints the new module's index
+                _loopback_modules[actual_sink_name] = result.stdout.strip()
+                results[prefix] = True
+        _invalidate_list("modules")
+    return results
 
 
 